@@ -62,9 +62,11 @@ def miller_rabin_primality_test(p: int, s: int, int_gen= None):
                 z = (z * z) % p
                 if z == 1:
                     return False
+                if z == p - 1:
+                    break
             if z != p - 1:
                 return False
-        return True
+    return True
     
 
 def is_prime(p: int) -> bool:
@@ -81,4 +83,33 @@ def is_prime(p: int) -> bool:
     if p in SMALL_PRIMES:
         return True
     
-    return miller_rabin_primality_test(p, 20, lambda a, b: random.randint(a, b - 1))
\ No newline at end of file
+    return miller_rabin_primality_test(p, 20, lambda a, b: random.randint(a, b - 1))
+
+def prime_power(n: int) -> tuple[int, int] | None:
+    r'''
+    Finds the decomposition $n = p^k$ of a prime power into it's prime $p$ and exponent $k \ge 1$.
+
+    Args:
+        n: Integer to be decomposed.
+
+    Returns:
+        Tuple (p, k) if n is a prime power, None otherwise.
+    '''
+    if n < 2:
+        return None
+
+    for k in range(n.bit_length(), 0, -1):
+        p = _integer_root(n, k)
+        if p >= 2 and p ** k == n and is_prime(p):
+            return p, k
+    return None
+
+
+def _integer_root(n: int, k: int) -> int:
+    r'''Computes $\lfloor n^{1/k} \rfloor$ for positive integer $n$ with Newton's iteration on integers.'''
+    x = 1 << -(-n.bit_length() // k)
+    while True:
+        y = ((k - 1) * x + n // x ** (k - 1)) // k
+        if y >= x:
+            return x
+        x = y
@@ -1,5 +1,6 @@
 from lbpqc.type_aliases import *
 from lbpqc.primitives import matrix
+from lbpqc.primitives.polynomial.polyqring import construct_ring
 
 def q_ary_basis(A: MatrixInt, q: int) -> MatrixModInt:
     r'''
@@ -40,6 +41,30 @@ def bai_galbraith_embedding(A: MatrixInt, b: VectorInt, q: int) -> SquareMatrixI
     pass
 
 
+def ntru_lattice(h: VectorInt, q: int, N: int | None = None) -> SquareMatrixInt:
+    r'''Constructs basis of the NTRU lattice for public key $h$ in the ring $\frac{\mathbb{Z}_q[X]}{X^N - 1}$, i.e. $2N$-dimensional lattice
+    $$
+    \begin{bmatrix}
+    I_N & H \\
+    0 & q I_N
+    \end{bmatrix}
+    $$
+    where rows of $H$ are rotations $X^i \cdot h$ (see `PolyQuotientRing.rotation_matrix`).
+    Lattice contains vector $(f, g)$ of private key polynomials.
+
+    Args:
+        h: Public key polynomial's coefficients array.
+        q: Integer modulus.
+        N: Degree of the ring's polynomial modulus, defaults to the length of `h`.
+
+    Returns:
+        Basis of the NTRU lattice with vectors in rows.
+    '''
+    N = len(h) if N is None else N
+    H = construct_ring("-", N, q).rotation_matrix(h)
+    return np.block([[np.identity(N, dtype=int), H], [np.zeros((N, N), dtype=int), q * np.identity(N, dtype=int)]])
+
+
 def CVP_embedding(lattice_basis: SquareMatrix, v: Vector, M = 1) -> SquareMatrix:
     r'''
 
@@ -0,0 +1,74 @@
+from lbpqc.type_aliases import *
+from lbpqc.primitives.lattice.reductions import GSO_coefficients, _enumerate
+
+
+class Enumeration:
+    r'''Schnorr-Euchner enumeration for exact shortest (SVP) and closest (CVP) vector problems.
+
+    For a lattice with basis $b_0, \ldots, b_{n-1}$ and target $t = \sum_i \tau_i b^*_i + t^\perp$ squared distance of lattice vector $\sum_i x_i b_i$ from $t$ is
+    $$
+    \|t^\perp\|^2 + \sum_{i} (x_i - c_i)^2 \|b^*_i\|^2, \quad c_i = \tau_i - \sum_{j > i} x_j \mu_{j,i},
+    $$
+    so the enumeration tree is traversed from the last coefficient, trying values of $x_i$ around the center $c_i$
+    and cutting off nodes whose partial squared length exceeds the bound. Radius shrinks every time a closer vector is found.
+    Enumeration itself is done by the vectorized engine of `reductions.enumerate_block` (also used by `reductions.BKZ`),
+    this class keeps the basis with it's Gram-Schmidt coefficients for repeated queries and handles radii and targets.
+
+    Basis should be LLL reduced (or better), running time grows quickly with the quality of the basis.
+
+    Attributes:
+        basis (MatrixFloat): Lattice basis with vectors in rows.
+        norms (VectorFloat): Squared norms of Gram-Schmidt vectors.
+        U (SquareMatrixFloat): Gram-Schmidt coefficients in the layout of `GSO_coefficients`, i.e. $U_{ij} = \mu_{j,i}$.
+        nodes (int): Number of enumeration tree nodes visited by the last call.
+    '''
+    def __init__(self, lattice_basis: Matrix, norms: VectorFloat | None = None, U: SquareMatrixFloat | None = None) -> None:
+        r'''Prepares enumeration for the basis, with precomputed Gram-Schmidt coefficients if they are given.
+
+        Args:
+            lattice_basis: (LLL reduced) matrix with linearly independent basis vectors in rows.
+            norms: Squared norms of Gram-Schmidt vectors, computed with `GSO_coefficients` if not given.
+            U: Gram-Schmidt coefficients (see `GSO_coefficients`), computed if not given.
+        '''
+        self.basis = lattice_basis.astype(float)
+        if norms is None or U is None:
+            norms, U = GSO_coefficients(self.basis)
+        self.norms = np.asarray(norms, dtype=float)
+        self.U = np.asarray(U, dtype=float)
+        self.nodes = 0
+        self._mu = self.U.T.copy()
+
+
+    def svp(self, radius: float | None = None, pruning: VectorFloat | None = None) -> VectorFloat | None:
+        r'''Finds the shortest nonzero vector of the lattice.
+
+        Args:
+            radius: Bound on the norm of the vector, defaults to $\|b_0\|$ (inclusive).
+            pruning: Optional non-decreasing coefficients $p_d \in (0, 1]$ for depths $d = 1, \ldots, n$ (e.g. `reductions.linear_pruning` or extreme pruning bounds),
+                partial squared length of the last $d$ coefficients is bounded by $p_d R^2$. Pruned enumeration may miss the solution.
+
+        Returns:
+            The shortest nonzero lattice vector with norm at most `radius`, or `None` if there is no (found) such vector.
+        '''
+        R2 = self.norms[0] if radius is None else radius ** 2
+        x, _, self.nodes = _enumerate(self._mu, self.norms, None, R2 * (1 + 1e-9), pruning)
+        return None if x is None else x @ self.basis
+
+
+    def cvp(self, target: VectorFloat, radius: float | None = None, pruning: VectorFloat | None = None) -> VectorFloat | None:
+        r'''Finds the lattice vector closest to the target.
+
+        Args:
+            target: Target vector from the span of the lattice (component orthogonal to the span doesn't change the solution).
+            radius: Bound on the distance from the target, defaults to $\frac{1}{2} \sqrt{\sum_i \|b^*_i\|^2}$, which always contains Babai's nearest plane solution.
+            pruning: Optional pruning coefficients (see `svp`).
+
+        Returns:
+            The closest lattice vector within distance `radius` from target, or `None` if there is no (found) such vector.
+        '''
+        # coordinates tau_i = <t, b*_i> / ||b*_i||^2 from B t = U^T B* t
+        projections = np.linalg.solve(self.U.T, self.basis @ np.asarray(target, dtype=float))
+        tau = projections / self.norms
+        R2 = np.sum(self.norms) / 4 if radius is None else radius ** 2
+        x, _, self.nodes = _enumerate(self._mu, self.norms, tau, R2 * (1 + 1e-9), pruning)
+        return None if x is None else x @ self.basis
@@ -3,14 +3,29 @@ from lbpqc.type_aliases import *
 
 @enforce_type_check
 def volume(lattice_basis: SquareMatrix) -> float:
-    r'''
+    r'''Volume (determinant) of the lattice, computed as $\exp$ of `log_volume`.
+    For bases of large dimension the volume itself may not fit into float, use `log_volume` then.
 
     Args:
+        lattice_basis: Square matrix with basis vectors in rows.
 
     Returns:
-    
+        Volume of the lattice.
+    '''
+    return float(np.exp(log_volume(lattice_basis)))
+
+
+@enforce_type_check
+def log_volume(lattice_basis: SquareMatrix) -> float:
+    r'''Natural logarithm of the volume of the lattice, computed with `np.linalg.slogdet`, so it's finite also when the determinant overflows float.
+
+    Args:
+        lattice_basis: Square matrix with basis vectors in rows.
+
+    Returns:
+        Logarithm of the volume of the lattice.
     '''
-    return abs(np.linalg.det(lattice_basis))
+    return float(np.linalg.slogdet(lattice_basis.astype(float))[1])
 
 
 @enforce_type_check
@@ -27,27 +42,74 @@ def rank(lattice_basis: SquareMatrix) -> int:
 
 @enforce_type_check
 def hadamard_ratio(lattice_basis: SquareMatrix) -> float:
-    r'''
+    r'''Hadamard ratio of the basis
+    $$
+    \left(\frac{\text{vol}(\mathcal{L})}{\prod_i \|b_i\|}\right)^{1/n}
+    $$
+    computed in the log domain (see `lattice_invariants`).
 
     Args:
+        lattice_basis: Square matrix with basis vectors in rows.
 
     Returns:
-    
+        Hadamard ratio from the interval $(0, 1]$.
     '''
-    return (volume(lattice_basis) / np.linalg.norm(lattice_basis, axis=1).prod()) ** (1/rank(lattice_basis))
+    _, log_hadamard, _, _ = lattice_invariants(lattice_basis)
+    return float(np.exp(log_hadamard))
 
 
 @enforce_type_check
 def gaussian_expected_shortest_length(lattice_basis: SquareMatrix) -> float:
-    r'''
+    r'''Gaussian heuristic for the length of the shortest vector of the lattice
+    $$
+    \sqrt{\frac{n}{2 \pi e}} \text{vol}(\mathcal{L})^{1/n}
+    $$
+    computed in the log domain (see `lattice_invariants`).
 
     Args:
+        lattice_basis: Square matrix with basis vectors in rows.
 
     Returns:
-    
+        Expected length of the shortest vector.
     '''
-    n = rank(lattice_basis)
-    return np.sqrt(n / (2 * np.pi * np.e)) * (volume(lattice_basis) ** (1/n))
+    _, _, _, gh = lattice_invariants(lattice_basis)
+    return float(gh)
+
+
+@enforce_type_check
+def root_hermite_factor(lattice_basis: SquareMatrix) -> float:
+    r'''Root Hermite factor $\delta$ of the basis, i.e. $\delta^n = \frac{\|b_0\|}{\text{vol}(\mathcal{L})^{1/n}}$, standard measure of the quality of reduced bases
+    (about $1.0219$ for LLL and smaller for BKZ).
+
+    Args:
+        lattice_basis: Square matrix with basis vectors in rows.
+
+    Returns:
+        Root Hermite factor of the basis.
+    '''
+    _, _, rhf, _ = lattice_invariants(lattice_basis)
+    return float(rhf)
+
+
+def lattice_invariants(lattice_bases: np.ndarray) -> Tuple[float | VectorFloat, float | VectorFloat, float | VectorFloat, float | VectorFloat]:
+    r'''Log-volume, log Hadamard ratio, root Hermite factor and Gaussian heuristic of a basis or of a whole batch of bases,
+    all computed from a single `np.linalg.slogdet` factorization and logarithms of row norms, so no intermediate value overflows
+    (e.g. for q-ary bases in hundreds of dimensions, whose volume doesn't fit into float).
+
+    Args:
+        lattice_bases: Square matrix with basis vectors in rows or array of shape `(k, n, n)` with $k$ such bases.
+
+    Returns:
+        Tuple (log_volume, log_hadamard_ratio, root_hermite_factor, gaussian_heuristic) of floats, or of vectors of length $k$ for a batch.
+    '''
+    B = np.asarray(lattice_bases, dtype=float)
+    n = B.shape[-1]
+    _, log_vol = np.linalg.slogdet(B)
+    log_norms = np.log(np.linalg.norm(B, axis=-1))
+    log_hadamard = (log_vol - log_norms.sum(axis=-1)) / n
+    rhf = np.exp((log_norms[..., 0] - log_vol / n) / n)
+    gh = np.exp(0.5 * np.log(n / (2 * np.pi * np.e)) + log_vol / n)
+    return log_vol, log_hadamard, rhf, gh
 
 
 @enforce_type_check
@@ -84,3 +146,133 @@ def dual_basis(lattice_basis: SquareMatrix) -> SquareMatrix:
     
     '''
     return np.linalg.inv(lattice_basis.T)
+
+
+class Lattice:
+    r'''Full rank lattice given by a fixed basis, with factorization of the basis and derived quantities computed lazily and cached.
+
+    Basis is factorized once with QR decomposition $B^T = QR$, after that:
+
+    - $\log \text{vol}(\mathcal{L}) = \sum_i \log |R_{ii}|$ and the profile $\log \|b^*_i\| = \log |R_{ii}|$ are read from the diagonal,
+    - coordinates $x$ of vectors $v = xB$ (e.g. for Babai's rounding) are found with back substitution $R x^T = Q^T v^T$ in $O(n^2)$ per vector,
+    - inverse $B^{-1} = Q R^{-T}$ and dual basis $B^{-T}$ are computed from the factors on first use.
+
+    All methods taking vectors accept also matrices with vectors in rows, which are processed together.
+
+    Attributes:
+        basis (SquareMatrix): Lattice basis with vectors in rows.
+    '''
+    def __init__(self, lattice_basis: SquareMatrix) -> None:
+        r'''Wraps the basis, nothing is computed until needed.
+
+        Args:
+            lattice_basis: Square matrix with linearly independent basis vectors in rows.
+        '''
+        self.basis = lattice_basis
+        self._qr = None
+        self._inverse = None
+
+
+    @property
+    def rank(self) -> int:
+        r'''Rank of the lattice.'''
+        return self.basis.shape[0]
+
+
+    @property
+    def qr(self) -> Tuple[SquareMatrixFloat, SquareMatrixFloat]:
+        r'''Factors $(Q, R)$ of QR decomposition $B^T = QR$, computed on first access.'''
+        if self._qr is None:
+            self._qr = np.linalg.qr(self.basis.astype(float).T)
+        return self._qr
+
+
+    @property
+    def log_volume(self) -> float:
+        r'''Natural logarithm of the volume (determinant) of the lattice.'''
+        return float(np.sum(np.log(np.abs(np.diag(self.qr[1])))))
+
+
+    @property
+    def volume(self) -> float:
+        r'''Volume (determinant) of the lattice.'''
+        return float(np.exp(self.log_volume))
+
+
+    @property
+    def profile(self) -> VectorFloat:
+        r'''Log-norm profile of the basis, i.e. vector of $\log \|b^*_i\|$ for it's Gram-Schmidt vectors.'''
+        return np.log(np.abs(np.diag(self.qr[1])))
+
+
+    @property
+    def inverse(self) -> SquareMatrixFloat:
+        r'''Inverse $B^{-1}$ of the basis, computed on first access.'''
+        if self._inverse is None:
+            Q, R = self.qr
+            self._inverse = Q @ _solve_upper(R, np.identity(self.rank)).T
+        return self._inverse
+
+
+    @property
+    def dual(self) -> SquareMatrixFloat:
+        r'''Basis $B^{-T}$ of the dual lattice with vectors in rows.'''
+        return self.inverse.T
+
+
+    def hadamard_ratio(self) -> float:
+        r'''Hadamard ratio $\left(\frac{\text{vol}(\mathcal{L})}{\prod_i \|b_i\|}\right)^{1/n}$ of the basis.'''
+        return float(np.exp((self.log_volume - np.sum(np.log(np.linalg.norm(self.basis, axis=1)))) / self.rank))
+
+
+    def root_hermite_factor(self) -> float:
+        r'''Root Hermite factor $\left(\frac{\|b_0\|}{\text{vol}(\mathcal{L})^{1/n}}\right)^{1/n}$ of the basis.'''
+        n = self.rank
+        return float(np.exp((np.log(np.linalg.norm(self.basis[0])) - self.log_volume / n) / n))
+
+
+    def gaussian_expected_shortest_length(self) -> float:
+        r'''Gaussian heuristic $\sqrt{\frac{n}{2 \pi e}} \text{vol}(\mathcal{L})^{1/n}$ for the length of the shortest vector.'''
+        n = self.rank
+        return float(np.sqrt(n / (2 * np.pi * np.e)) * np.exp(self.log_volume / n))
+
+
+    def coordinates(self, vectors: Vector | Matrix) -> VectorFloat | MatrixFloat:
+        r'''Coordinates $x = v B^{-1}$ of vectors with respect to the basis, computed with the cached factorization.
+
+        Args:
+            vectors: Vector or matrix of shape `(k, n)` with vectors in rows.
+
+        Returns:
+            Vector or matrix of shape `(k, n)` with coordinates in rows.
+        '''
+        Q, R = self.qr
+        V = np.atleast_2d(np.asarray(vectors, dtype=float))
+        X = _solve_upper(R, Q.T @ V.T).T
+        return X if np.ndim(vectors) == 2 else X[0]
+
+
+    def babai_cvp(self, targets: Vector | Matrix) -> VectorInt | MatrixInt:
+        r'''Babai's rounding, i.e. rounded coordinates $\lfloor t B^{-1} \rceil$ of the targets (see `babai_cvp`).
+
+        Args:
+            targets: Target vector or matrix of shape `(k, n)` with targets in rows.
+
+        Returns:
+            Integer coefficients vector or matrix of shape `(k, n)` with coefficients in rows.
+        '''
+        return np.rint(self.coordinates(targets)).astype(int)
+
+
+    def transition_matrix(self, to_basis: SquareMatrix) -> SquareMatrixInt:
+        r'''Integer matrix $T$ such that $T B$ is `to_basis` (see `transition_matrix`).'''
+        return np.rint(self.coordinates(to_basis)).astype(int)
+
+
+def _solve_upper(R: SquareMatrixFloat, Y: Matrix) -> MatrixFloat:
+    r'''Solves $R X = Y$ for upper triangular $R$ with back substitution, with all columns of $Y$ at once.'''
+    n = R.shape[0]
+    X = np.empty((n,) + Y.shape[1:])
+    for i in range(n - 1, -1, -1):
+        X[i] = (Y[i] - R[i, i + 1:] @ X[i + 1:]) / R[i, i]
+    return X
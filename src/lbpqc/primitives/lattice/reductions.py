@@ -1,28 +1,89 @@
+import math
+import time
+from fractions import Fraction
+
 from lbpqc.type_aliases import *
+from lbpqc.primitives.integer import integer_ring
+
+
+# relative tolerance of floating point Gram-Schmidt coefficients used in reducedness checks
+_GSO_RTOL = 1e-9
+
+# number of verified floating point passes of `LLL` before falling back to `LLL_L2`
+_LLL_FLOAT_ROUNDS = 8
+
+# number of `LLL` iterations between snapshots of the profile reported to callbacks
+_LLL_REPORT_INTERVAL = 1000
+
+# number of consecutive tours without flattening of the profile after which `BKZ` aborts
+_BKZ_AUTO_ABORT_TOURS = 5
+
+# largest block size for which `BKZ` enumerates without pruning by default
+_BKZ_PRUNING_BLOCK_SIZE = 30
+
+# maximal number of enumeration nodes expanded at once by `enumerate_block` (and `enumeration.Enumeration`)
+_ENUM_CHUNK = 1 << 14
 
 
 @enforce_type_check
 def GSO(B: Matrix) -> Tuple[MatrixFloat, SquareMatrixFloat]:
-    r'''
+    r'''Gram-Schmidt orthogonalization of basis vectors given in rows of $B$.
+
+    Computed with a single (LAPACK) QR decomposition $B^T = QR$:
+    $b^*_i = R_{ii} q_i$ and $\mu_{j,i} = R_{ij} / R_{ii}$.
 
     Args:
+        B: Matrix with basis vectors in rows.
 
     Returns:
-    
+        Tuple (B_star, U) of matrix with orthogonalized vectors in rows and upper triangular matrix with $U_{ij} = \mu_{j,i}$,
+        such that $B = U^T B^*$.
     '''
+    Q, R = _gso_qr(B)
+    d = np.diag(R)
+    B_star = (Q * d).T
+    return B_star, _mu_from_r(R)
+
+
+@enforce_type_check
+def GSO_coefficients(B: Matrix) -> Tuple[VectorFloat, SquareMatrixFloat]:
+    r'''Gram-Schmidt coefficients of basis vectors given in rows of $B$, without the orthogonalized vectors themselves,
+    i.e. squared norms $\|b^*_i\|^2$ and $\mu_{j,i}$ (in the same layout as `GSO`).
+
+    Computed with Cholesky decomposition of the Gram matrix $B B^T = R^T R$, so it costs $O(m^2 n)$ for the Gram matrix and $O(m^3)$ for the decomposition,
+    or with QR for linearly dependent (or numerically ill conditioned) rows.
+
+    Args:
+        B: Matrix with basis vectors in rows.
+
+    Returns:
+        Tuple (norms, U) of vector with squared norms of Gram-Schmidt vectors and upper triangular matrix with $U_{ij} = \mu_{j,i}$.
+    '''
+    B = B.astype(float)
+    try:
+        R = np.linalg.cholesky(B @ B.T).T
+    except np.linalg.LinAlgError:
+        _, R = _gso_qr(B)
+    return np.diag(R) ** 2, _mu_from_r(R)
+
+
+def _gso_qr(B: Matrix) -> Tuple[MatrixFloat, SquareMatrixFloat]:
+    r'''QR decomposition of $B^T$ padded to square $R$ of size $m$ also for $m > n$ (with zero Gram-Schmidt vectors for the surplus rows).'''
     m, n = B.shape
-    proj_coeff = lambda q, b: np.dot(b, q) / np.dot(q, q)
-    B_star = B.astype(float)
-    U = np.identity(m)
+    Q, R = np.linalg.qr(B.astype(float).T)
+    if m > n:
+        Q = np.hstack([Q, np.zeros((n, m - n))])
+        R = np.vstack([R, np.zeros((m - n, m))])
+    return Q, R
 
-    for j in range(1, m):
-        b = B_star[j].copy()
-        for i in range(j):
-            U[i,j] = proj_coeff(B_star[i], b)
-            B_star[j] -= U[i][j] * B_star[i]
-    
-    # B = U.T @ B_star
-    return B_star, U
+
+def _mu_from_r(R: SquareMatrixFloat) -> SquareMatrixFloat:
+    r'''Matrix $U$ with $U_{ij} = \mu_{j,i} = R_{ij} / R_{ii}$ and ones on the diagonal (coefficients of zero Gram-Schmidt vectors are set to zero).'''
+    d = np.diag(R)[:, np.newaxis]
+    U = np.divide(R, d, out=np.zeros_like(R), where=d != 0)
+    U = np.triu(U, 1)
+    np.fill_diagonal(U, 1.0)
+    return U
 
 
 def is_size_reduced(lattice_basis: Matrix) -> bool:
@@ -33,13 +94,13 @@ def is_size_reduced(lattice_basis: Matrix) -> bool:
     Returns:
     
     '''
-    _, U = GSO(lattice_basis)
-    return np.all(np.abs(U[np.fromfunction(lambda i, j: i < j, U.shape).nonzero()]) <= 0.5)
+    _, U = GSO_coefficients(lattice_basis)
+    return np.all(np.abs(U[np.triu_indices(U.shape[0], 1)]) <= 0.5 + _GSO_RTOL)
 
 
 def is_basis_vector_size_reduced(lattice_basis: Matrix, k: int) -> bool:
-    _, U = GSO(lattice_basis)
-    return np.all(np.abs(U[:k,k]) <= 0.5)
+    _, U = GSO_coefficients(lattice_basis)
+    return np.all(np.abs(U[:k,k]) <= 0.5 + _GSO_RTOL)
 
 
 def lovasz_condition(lattice_basis: Matrix, delta: float) -> bool:
@@ -50,11 +111,12 @@ def lovasz_condition(lattice_basis: Matrix, delta: float) -> bool:
     Returns:
     
     '''
-    norm2 = lambda x: np.sum(x * x, axis=1)
-    G, U = GSO(lattice_basis)
-    lhs = delta * norm2(G[:-1])
-    rhs = norm2(G[1:] + np.diag(U, 1)[:, np.newaxis] * G[:-1])
-    return np.all(lhs <= rhs)
+    # ||b*_{i+1} + mu_{i+1,i} b*_i||^2 = ||b*_{i+1}||^2 + mu_{i+1,i}^2 ||b*_i||^2
+    norms, U = GSO_coefficients(lattice_basis)
+    lhs = delta * norms[:-1]
+    rhs = norms[1:] + np.diag(U, 1) ** 2 * norms[:-1]
+    # relative tolerance keeps the (common for integer bases) equality case stable under rounding
+    return np.all(lhs <= rhs * (1 + _GSO_RTOL))
 
 
 def is_LLL_reduced(lattice_basis: Matrix, delta: float):
@@ -65,82 +127,909 @@ def is_LLL_reduced(lattice_basis: Matrix, delta: float):
     Returns:
     
     '''
-    return is_size_reduced(lattice_basis) and lovasz_condition(lattice_basis, delta)
+    return basis_report(lattice_basis, delta).is_LLL_reduced
 
 
-def size_reduction_of_basis_vector(lattice_basis: Matrix, k: int):
-    B = lattice_basis.astype(float)
-    m, n = B.shape
-    _, U = GSO(B)
+class BasisReport:
+    r'''Quality measures of a lattice basis computed by `basis_report` from a single Gram-Schmidt pass.
+
+    Attributes:
+        delta (float): Parameter of Lovász condition used for `lovasz_violations`.
+        size_violations (MatrixInt): Array of shape `(k, 2)` with pairs $(i, j)$, $j < i$, such that $|\mu_{i,j}| > \frac{1}{2}$.
+        lovasz_violations (VectorInt): Indices $i$ for which Lovász condition of $b_{i-1}, b_i$ doesn't hold.
+        profile (VectorFloat): Log-norm profile $\log \|b^*_i\|$.
+        slope (float): Slope of the least squares line fitted to the profile (negative, flatter for better reduced bases).
+        log_orthogonality_defect (float): Logarithm of the orthogonality defect $\frac{\prod_i \|b_i\|}{\prod_i \|b^*_i\|}$.
+        log_potential (float): Logarithm of the potential $\prod_i \|b^*_i\|^{2(m - i)}$, which strictly decreases with every swap of LLL.
+    '''
+    def __init__(self, delta: float, size_violations: MatrixInt, lovasz_violations: VectorInt, profile: VectorFloat,
+                 slope: float, log_orthogonality_defect: float, log_potential: float) -> None:
+        self.delta = delta
+        self.size_violations = size_violations
+        self.lovasz_violations = lovasz_violations
+        self.profile = profile
+        self.slope = slope
+        self.log_orthogonality_defect = log_orthogonality_defect
+        self.log_potential = log_potential
+
+
+    @property
+    def is_size_reduced(self) -> bool:
+        r'''Whether the basis is size reduced.'''
+        return len(self.size_violations) == 0
+
+
+    @property
+    def is_LLL_reduced(self) -> bool:
+        r'''Whether the basis is LLL reduced with parameter `delta`.'''
+        return self.is_size_reduced and len(self.lovasz_violations) == 0
+
+
+    def __repr__(self) -> str:
+        return (f"BasisReport(size_violations={len(self.size_violations)}, lovasz_violations={len(self.lovasz_violations)}, "
+                f"slope={self.slope:.6f}, log_orthogonality_defect={self.log_orthogonality_defect:.6f}, log_potential={self.log_potential:.6f})")
+
+
+def basis_report(lattice_basis: Matrix, delta: float = 0.75) -> BasisReport:
+    r'''Computes reducedness checks and quality measures of the basis with one Gram-Schmidt pass (see `GSO_coefficients`),
+    e.g. for monitoring of a reduction run.
+
+    Args:
+        lattice_basis: Matrix with linearly independent basis vectors in rows.
+        delta: Parameter $\delta$ of Lovász condition.
+
+    Returns:
+        Report with size reduction and Lovász condition violations, profile, it's slope, orthogonality defect and potential (see `BasisReport`).
+    '''
+    norms, U = GSO_coefficients(lattice_basis)
+    m = len(norms)
+    # U_ij = mu_ji, so the violating pair is (j, i)
+    rows, cols = np.triu_indices(m, 1)
+    violating = np.abs(U[rows, cols]) > 0.5 + _GSO_RTOL
+    size_violations = np.stack([cols[violating], rows[violating]], axis=1)
+    lhs = delta * norms[:-1]
+    rhs = norms[1:] + np.diag(U, 1) ** 2 * norms[:-1]
+    lovasz_violations = np.nonzero(lhs > rhs * (1 + _GSO_RTOL))[0] + 1
+
+    profile = 0.5 * np.log(norms)
+    log_orthogonality_defect = float(np.sum(np.log(np.linalg.norm(lattice_basis.astype(float), axis=1))) - np.sum(profile))
+    log_potential = float(np.sum(2 * (m - np.arange(m)) * profile))
+    return BasisReport(delta, size_violations, lovasz_violations, profile, _slope(profile), log_orthogonality_defect, log_potential)
+
+
+def _slope(profile: VectorFloat) -> float:
+    r'''Slope of the least squares line fitted to the profile.'''
+    return float(np.polyfit(np.arange(len(profile)), profile, 1)[0])
+
+
+def size_reduce(B: MatrixFloat, U: SquareMatrixFloat, k: int, T: MatrixInt | None = None) -> VectorFloat:
+    r'''Size reduces basis vector $b_k$ against all the previous vectors $b_0, \ldots, b_{k-1}$, in place.
+
+    Coefficients are found with back substitution on the column $U_{\cdot, k} = (\mu_{k,0}, \ldots, \mu_{k,k-1})$:
+    for $j = k - 1, \ldots, 0$ coefficient $x_j = \lfloor \mu_{k,j} \rceil$ is subtracted together with $x_j$ times the column of $b_j$ (one vectorized update of the column's prefix),
+    and the basis vector (and row of the transform) is updated once at the end with a single product $b_k \leftarrow b_k - \sum_j x_j b_j$.
+
+    Args:
+        B: Float matrix with basis vectors in rows, modified in place.
+        U: Gram-Schmidt coefficients $U_{ij} = \mu_{j,i}$ (see `GSO_coefficients`), column $k$ is modified in place.
+        k: Index of the reduced vector.
+        T: Optional integer matrix with rows transformed along the basis, e.g. unimodular transform $T$ with $B = T B_0$ for the original basis $B_0$.
+
+    Returns:
+        Vector of the $k$ subtracted coefficients $x_j$.
+    '''
+    c = U[:k, k].copy()
+    x = np.zeros(k)
     for j in range(k - 1, -1, -1):
-        if abs(U[j, k]) > 0.5:
-            B[k] -= np.rint(U[j,k]) * B[j]
-            for i in range(m):
-                U[i, k] -= round(U[j, k]) * U[i, j]
+        if abs(c[j]) > 0.5:
+            r = np.rint(c[j])
+            x[j] = r
+            c[:j] -= r * U[:j, j]
+            c[j] -= r
+    U[:k, k] = c
+    B[k] -= x @ B[:k]
+    if T is not None:
+        T[k] -= x.astype(T.dtype) @ T[:k]
+    return x
+
+
+def size_reduction_of_basis_vector(lattice_basis: Matrix, k: int) -> Tuple[MatrixFloat, SquareMatrixFloat]:
+    r'''Size reduces basis vector $b_k$ against the previous vectors (see `size_reduce`).
+
+    Args:
+        lattice_basis: Matrix with basis vectors in rows.
+        k: Index of the reduced vector.
+
+    Returns:
+        Tuple (B, U) of the basis with reduced vector and it's Gram-Schmidt coefficients.
+    '''
+    B = lattice_basis.astype(float)
+    _, U = GSO_coefficients(B)
+    size_reduce(B, U, k)
     return B, U
 
-def size_reduction(lattice_basis: Matrix):
+
+def size_reduction(lattice_basis: Matrix, transform: bool = False) -> MatrixFloat | Tuple[MatrixFloat, MatrixInt]:
+    r'''Size reduction of the whole basis, i.e. every vector is size reduced against the previous ones (see `size_reduce`).
+    Reduction of $b_k$ changes only $\mu_{k, \cdot}$, so vectors are processed independently with one Gram-Schmidt computation.
+
+    Args:
+        lattice_basis: Matrix with basis vectors in rows.
+        transform: Whether to return also the unimodular transform.
+
+    Returns:
+        Size reduced basis, with `transform` tuple of the basis and unimodular integer matrix $T$ such that the reduced basis is $T B$.
+    '''
     B = lattice_basis.astype(float)
-    m, n = B.shape
-    _, U = GSO(B)
+    m = B.shape[0]
+    _, U = GSO_coefficients(B)
+    T = np.identity(m, dtype=int) if transform else None
+    for k in range(1, m):
+        size_reduce(B, U, k, T)
+    return (B, T) if transform else B
 
-    for k in range(m - 1, -1, -1):
-        for j in range(k - 1, -1, -1):
-            B[k] -= round(U[j,k]) * B[j]
-            for i in range(m):
-                U[k, i] -= round(U[j, k]) * U[i, j]
-    return B
 
 
 
+def LLL(lattice_basis: SquareMatrix, delta: float = 0.75, stats: "ReductionStats | None" = None, callback: Callable | None = None,
+        time_limit: float | None = None, max_iterations: int | None = None) -> SquareMatrixFloat | SquareMatrixInt:
+    r'''Lenstra-Lenstra-Lovász lattice basis reduction.
 
-def LLL(lattice_basis: SquareMatrix, delta: float = 0.75) -> SquareMatrixFloat:
-    r'''
+    Gram-Schmidt coefficients are computed once and then updated incrementally after every size reduction step and swap (Cohen's variant),
+    the current index $k$ moves forward when Lovász condition holds for $b_{k-1}, b_k$ and backward after a swap,
+    vector $b_k$ is size reduced only against $b_{k-1}$ before the test and fully once the test passes.
+    Because the updates are done in floating point arithmetic, the result is verified with freshly computed coefficients
+    and the reduction is resumed from the current basis if rounding errors accumulated.
+    Integer bases with entries not representable exactly in float64, or for which float64 Gram-Schmidt coefficients overflow,
+    are reduced with `LLL_L2` instead (with the same statistics and budgets) and finished with exact `LLL_integral`, so the result is LLL reduced with $\eta = \frac{1}{2}$ as well.
+
+    Progress is counted in `stats` (see `ReductionStats`), profile snapshots are taken every 1000 iterations and at the end, and passed to `callback`.
+    When `time_limit` or `max_iterations` runs out (or the callback returns `True`) reduction stops and the partially reduced basis is returned,
+    it's still a basis of the same lattice, and `stats.completed` is `False`.
 
     Args:
+        lattice_basis: Matrix with basis vectors in rows.
+        delta: Parameter $\delta \in (\frac{1}{4}, 1)$ of Lovász condition.
+        stats: Optional statistics object filled during the run.
+        callback: Optional function called with the statistics object on every snapshot, returning `True` stops the reduction.
+        time_limit: Optional wall-clock budget in seconds.
+        max_iterations: Optional budget of iterations of the main loop.
 
     Returns:
-    
+        LLL reduced basis with vectors in rows (partially reduced if a budget ran out).
+        Float matrix, unless it was reduced with `LLL_L2` and some of it's entries are not exactly representable in float64,
+        then the exact integer matrix returned by `LLL_L2` is returned.
     '''
-    n = lattice_basis.shape[0]
+    monitor = _Monitor.create(stats, callback, time_limit, max_iterations, _LLL_REPORT_INTERVAL)
+    B = _lll(lattice_basis, delta, monitor)
+    if monitor is not None:
+        monitor.finish(B)
+    return B
+
+
+def _lll(lattice_basis: SquareMatrix, delta: float, monitor: "_Monitor | None" = None) -> SquareMatrixFloat | SquareMatrixInt:
+    r'''`LLL` reporting progress to the monitor.'''
+    integral = lattice_basis.dtype.kind in "iuO"
+    if integral and np.max(np.abs(lattice_basis)) >= 2 ** 53:
+        return _exact_LLL(lattice_basis, delta, monitor)
+
     B = lattice_basis.astype(float)
-    while True:
-        Bstar, _ = GSO(B)
-        # Reduction Step
-        for i in range(1, n):
-            for j in range(i-1, -1, -1):
-                cij = round(np.dot(B[i], Bstar[j]) / np.dot(Bstar[j], Bstar[j]))
-                B[i] = B[i] - cij * B[j]
-        # Swap step
-        exists = False
-        for i in range(n - 1):
-            u = np.dot(B[i + 1], Bstar[i]) / np.dot(Bstar[i], Bstar[i])
-            r = u * Bstar[i] + Bstar[i + 1]
-            if delta * np.dot(Bstar[i], Bstar[i]) > np.dot(r, r):
-                B[[i, i + 1]] = B[[i + 1, i]]
-                exists = True
+    for _ in range(_LLL_FLOAT_ROUNDS):
+        norms, U = GSO_coefficients(B)
+        with np.errstate(invalid="ignore", over="ignore"):
+            _lll_incremental(B, norms, U.T.copy(), delta, monitor)
+        if monitor is not None and monitor.stopped:
+            return B
+        norms, U = GSO_coefficients(B)
+        mu = U.T
+        if not (np.all(np.isfinite(norms)) and np.all(np.isfinite(mu))):
+            if integral:
+                return _exact_LLL(lattice_basis, delta, monitor)
+            raise ValueError("floating point precision lost during LLL reduction")
+        if np.all(np.abs(np.tril(mu, -1)) <= 0.5 + _GSO_RTOL) and \
+           np.all(delta * norms[:-1] <= (norms[1:] + np.diag(mu, -1) ** 2 * norms[:-1]) * (1 + _GSO_RTOL)):
+            return B
+
+    if integral:
+        return _exact_LLL(lattice_basis, delta, monitor)
+    raise ValueError("floating point LLL reduction did not converge")
+
+
+def _exact_LLL(lattice_basis: SquareMatrixInt, delta: float, monitor: "_Monitor | None") -> SquareMatrixFloat | SquareMatrixInt:
+    r'''`LLL_L2` of integral basis, converted to floats only if the reduced basis is exactly representable in float64.
+    `LLL_L2` size reduces only up to $\eta = 0.51$, so it's result is finished with exact `LLL_integral` (cheap for an almost reduced basis),
+    which guarantees $|\mu_{i,j}| \le \frac{1}{2}$ and Lovász condition with exact $\delta$.
+    '''
+    B = _lll_l2(lattice_basis, delta, 0.51, monitor)
+    if monitor is None or not monitor.stopped:
+        B = LLL_integral(B, delta)
+    if np.max(np.abs(B)) < 2 ** 53:
+        return B.astype(float)
+    return B
+
+
+class ReductionStats:
+    r'''Statistics of a lattice reduction run (`LLL`, `BKZ`), updated in place during the run, e.g. for charting progress from a callback.
+
+    Attributes:
+        iterations (int): Iterations of LLL's main loop (summed over all LLL calls of BKZ).
+        swaps (int): Swaps of neighbouring basis vectors.
+        size_reductions (int): Size reduction steps, i.e. subtractions $b_k \leftarrow b_k - x b_j$.
+        tours (int): Finished BKZ tours.
+        insertions (int): Vectors inserted by BKZ.
+        potential (float | None): Logarithm of the potential $\prod_i \|b^*_i\|^{2(m - i)}$ at the last snapshot.
+        profiles (list): Snapshots of the log-norm profile $\log \|b^*_i\|$.
+        elapsed (float): Wall-clock time in seconds since the start of the run.
+        completed (bool): `False` if the run was stopped by a budget or by the callback.
+    '''
+    def __init__(self) -> None:
+        self.iterations = 0
+        self.swaps = 0
+        self.size_reductions = 0
+        self.tours = 0
+        self.insertions = 0
+        self.potential = None
+        self.profiles = []
+        self.elapsed = 0.0
+        self.completed = True
+
+
+    def __repr__(self) -> str:
+        return (f"ReductionStats(iterations={self.iterations}, swaps={self.swaps}, size_reductions={self.size_reductions}, "
+                f"tours={self.tours}, insertions={self.insertions}, elapsed={self.elapsed:.3f}, completed={self.completed})")
+
+
+class _Monitor:
+    r'''Budgets, callback and statistics of a single reduction run.'''
+    def __init__(self, stats: ReductionStats, callback: Callable | None, time_limit: float | None, max_iterations: int | None, interval: int | None) -> None:
+        self.stats = stats
+        self.callback = callback
+        self.interval = interval
+        self.start = time.perf_counter()
+        self.deadline = None if time_limit is None else self.start + time_limit
+        self.max_iterations = max_iterations
+        self.stopped = False
+        self.reported = None
+
+
+    @staticmethod
+    def create(stats: ReductionStats | None, callback: Callable | None, time_limit: float | None, max_iterations: int | None, interval: int | None) -> "_Monitor | None":
+        r'''Monitor for the run, or `None` if no instrumentation was requested (so the hot loops skip it entirely).'''
+        if stats is None and callback is None and time_limit is None and max_iterations is None:
+            return None
+        return _Monitor(ReductionStats() if stats is None else stats, callback, time_limit, max_iterations, interval)
+
+
+    def step(self, profile: Callable) -> bool:
+        r'''Counts an iteration of LLL, takes a periodic snapshot (of the log-norm profile returned by `profile()`) and checks budgets.
+        Returns `True` if the run has to stop.
+        '''
+        self.stats.iterations += 1
+        if self.interval is not None and self.stats.iterations % self.interval == 0:
+            self.snapshot(profile())
+        return self.out_of_budget()
+
+
+    def out_of_budget(self) -> bool:
+        if self.max_iterations is not None and self.stats.iterations >= self.max_iterations:
+            self.stopped = True
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            self.stopped = True
+        return self.stopped
+
+
+    def snapshot(self, profile: VectorFloat) -> None:
+        m = len(profile)
+        self.reported = (self.stats.iterations, self.stats.tours)
+        self.stats.profiles.append(profile)
+        self.stats.potential = float(np.sum(2 * (m - np.arange(m)) * profile))
+        self.stats.elapsed = time.perf_counter() - self.start
+        if self.callback is not None and self.callback(self.stats):
+            self.stopped = True
+
+
+    def finish(self, B: MatrixFloat) -> None:
+        stopped = self.stopped
+        # final snapshot, unless the state was just reported
+        if self.reported != (self.stats.iterations, self.stats.tours):
+            self.snapshot(_exact_log_profile(B))
+        self.stats.elapsed = time.perf_counter() - self.start
+        self.stats.completed = not stopped
+
+
+def _exact_log_profile(B: Matrix) -> VectorFloat:
+    r'''`log_profile` also for integer bases with large entries, for which float64 Gram-Schmidt vectors may degenerate,
+    then it's computed from exact integral Gram-Schmidt coefficients $d_i$ as $\log \|b^*_i\| = \frac{1}{2} (\log d_{i+1} - \log d_i)$.
+    '''
+    if B.dtype.kind == "f":
+        return log_profile(B)
+    with np.errstate(all="ignore"):
+        norms, _ = GSO_coefficients(B)
+    if np.all(np.isfinite(norms)) and np.all(norms > 0):
+        return 0.5 * np.log(norms)
+    M = np.array([[int(x) for x in row] for row in B], dtype=object)
+    d, _ = _integral_gso(M @ M.T, M.shape[0] - 1)
+    log_d = [math.log(x) for x in d]
+    return 0.5 * np.diff(log_d)
+
+
+def _size_reduce_step(B: MatrixFloat, mu: SquareMatrixFloat, k: int, j: int) -> None:
+    r'''Subtracts $\lfloor \mu_{k,j} \rceil b_j$ from $b_k$ and updates $\mu_{k, \cdot}$ accordingly (in place).'''
+    r = np.rint(mu[k, j])
+    if r != 0:
+        B[k] -= r * B[j]
+        mu[k, :j] -= r * mu[j, :j]
+        mu[k, j] -= r
+
+
+def _lll_incremental(B: MatrixFloat, norms: VectorFloat, mu: SquareMatrixFloat, delta: float, monitor: "_Monitor | None" = None) -> None:
+    r'''In place LLL of basis $B$ with squared norms of Gram-Schmidt vectors and lower triangular matrix of $\mu_{k,j}$ kept up to date.'''
+    m = B.shape[0]
+    k = 1
+    while k < m:
+        if monitor is not None and monitor.step(lambda: 0.5 * np.log(norms)):
+            return
+        if abs(mu[k, k - 1]) > 0.5:
+            _size_reduce_step(B, mu, k, k - 1)
+            if monitor is not None:
+                monitor.stats.size_reductions += 1
+
+        if norms[k] >= (delta - mu[k, k - 1] ** 2) * norms[k - 1]:
+            x = size_reduce(B, mu.T, k)
+            if monitor is not None:
+                monitor.stats.size_reductions += np.count_nonzero(x)
+            k += 1
+            continue
+
+        # swap b_{k-1} and b_k, only norms of b*_{k-1}, b*_k and coefficients in rows and columns k-1, k change
+        mu_k = mu[k, k - 1]
+        norm = norms[k] + mu_k ** 2 * norms[k - 1]
+        if not np.isfinite(norm) or norm == 0:
+            # precision lost, leave the decision to the caller
+            return
+        mu[k, k - 1] = mu_k * norms[k - 1] / norm
+        norms[k] = norms[k - 1] * norms[k] / norm
+        norms[k - 1] = norm
+        B[[k - 1, k]] = B[[k, k - 1]]
+        mu[[k - 1, k], :k - 1] = mu[[k, k - 1], :k - 1]
+        t = mu[k + 1:, k].copy()
+        mu[k + 1:, k] = mu[k + 1:, k - 1] - mu_k * t
+        mu[k + 1:, k - 1] = t + mu[k, k - 1] * mu[k + 1:, k]
+        k = max(1, k - 1)
+        if monitor is not None:
+            monitor.stats.swaps += 1
+
+
+def LLL_integral(lattice_basis: MatrixInt, delta: float = 0.75) -> MatrixInt:
+    r'''Exact integral LLL (de Weger's variant), with all arithmetic done on python's integers.
+
+    Instead of rational Gram-Schmidt coefficients the algorithm keeps integers
+    $d_i = \prod_{j < i} \|b^*_j\|^2$ and $\lambda_{k,j} = d_{j+1} \mu_{k,j}$, which are updated with exact divisions,
+    so the result is correct for bases with arbitrarily large entries (e.g. knapsack or q-ary embeddings with large moduli).
+
+    Args:
+        lattice_basis: Integer matrix with linearly independent basis vectors in rows.
+        delta: Parameter $\delta \in (\frac{1}{4}, 1]$ of Lovász condition, it's converted to an exact fraction.
+
+    Returns:
+        LLL reduced basis with vectors in rows, with int dtype if entries fit into int64 (object dtype otherwise).
+
+    Raises:
+        ValueError: If basis vectors are linearly dependent.
+    '''
+    a, b = Fraction(delta).as_integer_ratio()
+    B = [[int(x) for x in row] for row in lattice_basis]
+    m = len(B)
+    dot = lambda u, v: sum(x * y for x, y in zip(u, v))
+
+    d = [1] + [0] * m
+    lam = [[0] * m for _ in range(m)]
+    d[1] = dot(B[0], B[0])
+    if d[1] == 0:
+        raise ValueError("basis vectors are linearly dependent")
+
+    k, k_max = 1, 0
+    while k < m:
+        if k > k_max:
+            # incremental Gram-Schmidt of the new vector
+            k_max = k
+            for j in range(k + 1):
+                u = dot(B[k], B[j])
+                for i in range(j):
+                    u = (d[i + 1] * u - lam[k][i] * lam[j][i]) // d[i]
+                if j < k:
+                    lam[k][j] = u
+                else:
+                    d[k + 1] = u
+            if d[k + 1] == 0:
+                raise ValueError("basis vectors are linearly dependent")
+
+        _integral_size_reduce(B, d, lam, k, k - 1)
+        # Lovász condition: d_{k+1} d_{k-1} >= delta d_k^2 - lambda_{k,k-1}^2
+        if b * (d[k + 1] * d[k - 1] + lam[k][k - 1] ** 2) < a * d[k] ** 2:
+            _integral_swap(B, d, lam, k, k_max)
+            k = max(1, k - 1)
+        else:
+            for j in range(k - 2, -1, -1):
+                _integral_size_reduce(B, d, lam, k, j)
+            k += 1
+
+    return _to_int_matrix(B)
+
+
+def _integral_size_reduce(B: list, d: list, lam: list, k: int, j: int) -> None:
+    r'''Exact size reduction of $b_k$ by $b_j$ in de Weger's representation (in place).'''
+    if 2 * abs(lam[k][j]) > d[j + 1]:
+        r = (2 * lam[k][j] + d[j + 1]) // (2 * d[j + 1])
+        B[k] = [x - r * y for x, y in zip(B[k], B[j])]
+        lam[k][j] -= r * d[j + 1]
+        for i in range(j):
+            lam[k][i] -= r * lam[j][i]
+
+
+def _integral_swap(B: list, d: list, lam: list, k: int, k_max: int) -> None:
+    r'''Exact swap of $b_{k-1}$ and $b_k$ in de Weger's representation (in place).'''
+    B[k - 1], B[k] = B[k], B[k - 1]
+    for j in range(k - 1):
+        lam[k - 1][j], lam[k][j] = lam[k][j], lam[k - 1][j]
+    l = lam[k][k - 1]
+    new = (d[k - 1] * d[k + 1] + l * l) // d[k]
+    for i in range(k + 1, k_max + 1):
+        t = lam[i][k]
+        lam[i][k] = (d[k + 1] * lam[i][k - 1] - l * t) // d[k]
+        lam[i][k - 1] = (new * t + l * lam[i][k]) // d[k + 1]
+    d[k] = new
+
+
+def _to_int_matrix(B: list) -> MatrixInt:
+    r'''Converts list of rows of python's integers to numpy's matrix, with int dtype when possible.'''
+    M = np.array(B, dtype=object)
+    if all(-2 ** 63 < x < 2 ** 63 for x in M.flat):
+        return M.astype(int)
+    return M
+
+
+def _integral_gso(G: MatrixInt, k: int) -> Tuple[list, list]:
+    r'''Exact $d_i$ and $\lambda_{i,j}$ (see `LLL_integral`) of the first $k + 1$ vectors computed from their exact Gram matrix.'''
+    d = [1] + [0] * (k + 1)
+    lam = [[0] * (k + 1) for _ in range(k + 1)]
+    for i in range(k + 1):
+        for j in range(i + 1):
+            u = int(G[i, j])
+            for l in range(j):
+                u = (d[l + 1] * u - lam[i][l] * lam[j][l]) // d[l]
+            if j < i:
+                lam[i][j] = u
+            else:
+                d[i + 1] = u
+    return d, lam
+
+
+def LLL_L2(lattice_basis: MatrixInt, delta: float = 0.75, eta: float = 0.51, stats: ReductionStats | None = None, callback: Callable | None = None,
+           time_limit: float | None = None, max_iterations: int | None = None) -> MatrixInt:
+    r'''Floating point LLL in the style of Nguyen-Stehlé's $L^2$ algorithm, with exact fallback on precision loss.
+
+    Basis and it's Gram matrix are kept exact (python's integers), Gram-Schmidt coefficients are approximated in float64
+    and recomputed for the current vector $b_k$ from the exact Gram matrix (Cholesky-like recurrence), so rounding errors do not accumulate along the run.
+    Vector $b_k$ is lazily size reduced (until $|\mu_{k,j}| \le \eta$) with repeated floating point passes.
+    If a pass makes no progress, coefficients are not finite (e.g. Gram entries above the float range) or $\|b^*_k\|^2$ isn't positive,
+    the precision is considered lost and that single step (size reduction and Lovász test of $b_k$) is done exactly, with de Weger's integral coefficients.
+    Easy inputs thus run in floating point only, while bases with large entries are still reduced correctly.
+
+    Statistics, callback and budgets work as in `LLL`, the budgets are checked once per iteration (i.e. per size reduction and Lovász test of $b_k$).
+
+    Args:
+        lattice_basis: Integer matrix with linearly independent basis vectors in rows.
+        delta: Parameter $\delta \in (\frac{1}{4}, 1)$ of Lovász condition.
+        eta: Size reduction parameter $\eta \in [\frac{1}{2}, \sqrt{\delta})$.
+        stats: Optional statistics object filled during the run.
+        callback: Optional function called with the statistics object on every snapshot, returning `True` stops the reduction.
+        time_limit: Optional wall-clock budget in seconds.
+        max_iterations: Optional budget of iterations of the main loop.
+
+    Returns:
+        LLL reduced basis with vectors in rows (partially reduced if a budget ran out), with int dtype if entries fit into int64 (object dtype otherwise).
+    '''
+    monitor = _Monitor.create(stats, callback, time_limit, max_iterations, _LLL_REPORT_INTERVAL)
+    B = _lll_l2(lattice_basis, delta, eta, monitor)
+    if monitor is not None:
+        monitor.finish(B)
+    return B
+
+
+def _lll_l2(lattice_basis: MatrixInt, delta: float, eta: float, monitor: "_Monitor | None" = None) -> MatrixInt:
+    r'''`LLL_L2` reporting progress to the monitor.'''
+    a, b = Fraction(delta).as_integer_ratio()
+    B = np.array([[int(x) for x in row] for row in lattice_basis], dtype=object)
+    m = B.shape[0]
+    G = B @ B.T
+    # coefficients are updated one row at a time, plain python floats are much faster than numpy's calls on such short rows
+    r = [[0.0] * m for _ in range(m)]
+    mu = [[0.0] * m for _ in range(m)]
+
+    def approximate_row(k: int) -> bool:
+        # r_kj = <b_k, b_j> - sum_{i<j} mu_ji r_ki,  mu_kj = r_kj / r_jj
+        try:
+            g = [float(x) for x in G[k, :k + 1]]
+        except OverflowError:
+            return False
+        rk, muk = r[k], mu[k]
+        for j in range(k):
+            muj, s = mu[j], g[j]
+            for i in range(j):
+                s -= muj[i] * rk[i]
+            rk[j] = s
+            muk[j] = s / r[j][j]
+        s = g[k]
+        for i in range(k):
+            s -= muk[i] * rk[i]
+        rk[k] = s
+        return math.isfinite(sum(rk[:k + 1])) and s > 0
+
+    def reduce_by(k: int, j: int, x: int) -> None:
+        if monitor is not None:
+            monitor.stats.size_reductions += 1
+        B[k] -= x * B[j]
+        row = G[k] - x * G[j]
+        row[k] = G[k, k] - 2 * x * G[k, j] + x * x * G[j, j]
+        G[k], G[:, k] = row, row
+
+    def swap(k: int) -> None:
+        B[[k - 1, k]] = B[[k, k - 1]]
+        G[[k - 1, k]] = G[[k, k - 1]]
+        G[:, [k - 1, k]] = G[:, [k, k - 1]]
+
+    if not approximate_row(0):
+        r[0][0] = math.inf
+    k = 1
+    while k < m:
+        if monitor is not None and monitor.step(lambda: _exact_log_profile(B)):
+            break
+        exact = not approximate_row(k)
+        previous = math.inf
+        while not exact:
+            largest = max(map(abs, mu[k][:k]))
+            if largest <= eta:
+                break
+            if largest >= previous:
+                exact = True
+                break
+            previous = largest
+            for j in range(k - 1, -1, -1):
+                x = round(mu[k][j])
+                if x != 0:
+                    reduce_by(k, j, x)
+                    muk, muj = mu[k], mu[j]
+                    for i in range(j):
+                        muk[i] -= x * muj[i]
+            exact = not approximate_row(k)
+
+        if exact:
+            # precision lost, size reduction and Lovász test of b_k with exact integral Gram-Schmidt coefficients
+            d, lam = _integral_gso(G, k)
+            for j in range(k - 1, -1, -1):
+                if 2 * abs(lam[k][j]) > d[j + 1]:
+                    x = (2 * lam[k][j] + d[j + 1]) // (2 * d[j + 1])
+                    reduce_by(k, j, x)
+                    lam[k][j] -= x * d[j + 1]
+                    for i in range(j):
+                        lam[k][i] -= x * lam[j][i]
+            approximate_row(k)
+            lovasz = b * (d[k + 1] * d[k - 1] + lam[k][k - 1] ** 2) >= a * d[k] ** 2
+        else:
+            lovasz = delta * r[k - 1][k - 1] <= r[k][k] + mu[k][k - 1] ** 2 * r[k - 1][k - 1]
+
+        if lovasz:
+            k += 1
+        else:
+            swap(k)
+            if monitor is not None:
+                monitor.stats.swaps += 1
+            k = max(1, k - 1)
+            if k == 1 and not approximate_row(0):
+                r[0][0] = math.inf
+
+    return _to_int_matrix(B.tolist())
+
+
+def BKZ(lattice_basis: SquareMatrix, block_size: int, delta: float = 0.99, max_tours: int | None = None,
+        auto_abort: bool = True, pruning: bool | None = None, block_svp: Callable | None = None, return_profiles: bool = False,
+        stats: ReductionStats | None = None, callback: Callable | None = None, time_limit: float | None = None) -> SquareMatrixFloat | Tuple[SquareMatrixFloat, MatrixFloat]:
+    r'''Block Korkine-Zolotarev reduction (Schnorr-Euchner's BKZ).
+
+    Basis is LLL reduced first, then every tour goes through the blocks $b_k, \ldots, b_{h-1}$ with $h = \min(k + \beta, m)$
+    and finds the shortest vector of the projected block lattice $\pi_k(\mathcal{L}(b_k, \ldots, b_{h-1}))$ with enumeration (see `enumerate_block`).
+    If the vector is shorter than $\sqrt{\delta} \|b^*_k\|$, it's inserted at the position $k$ with unimodular transformation of the block
+    (so no linear dependency arises) and the vectors $b_0, \ldots, b_{h-1}$ are LLL reduced again.
+
+    Reduction stops after a tour without any insertion, after `max_tours` tours (early abort) or, with `auto_abort`,
+    when the slope of the log-norm profile $\log \|b^*_i\|$ did not flatten for 5 consecutive tours.
+    With `pruning` the enumeration uses linear pruning, i.e. partial squared lengths on depth $d$ of the enumeration tree are bounded by $\frac{d}{\beta} R^2$,
+    which makes large blocks much faster, at the cost of sometimes missing the shortest vector of the block (linear pruning succeeds with probability about $\frac{1}{\beta}$
+    and blocks are not re-randomized), so by default only blocks larger than 30 are pruned.
+    Enumeration can be replaced with another block SVP solver with `block_svp`, e.g. `sieve.sieve_block` for blocks where enumeration gets too slow.
+
+    Progress is counted in `stats` (see `ReductionStats`, LLL counters are summed over all LLL calls), profile snapshot is taken after every tour and passed to `callback`.
+    When `time_limit` runs out (checked before every block) or the callback returns `True`, the partially reduced basis is returned.
+
+    Args:
+        lattice_basis: Matrix with linearly independent basis vectors in rows.
+        block_size: Block size $\beta \ge 2$, $\beta = 2$ gives LLL reduced basis, $\beta = m$ HKZ-like one.
+        delta: Parameter $\delta \in (\frac{1}{4}, 1)$ of Lovász condition and of the insertion test.
+        max_tours: Maximal number of tours, unlimited if `None`.
+        auto_abort: Whether to stop when the profile stops improving.
+        pruning: Whether to use linearly pruned enumeration, defaults to pruning for block sizes above 30 only.
+        block_svp: Optional solver with the signature of `enumerate_block` without pruning, i.e. `(mu, norms, radius)`, used instead of enumeration.
+        return_profiles: Whether to return also log-norm profiles after every tour.
+        stats: Optional statistics object filled during the run.
+        callback: Optional function called with the statistics object after every tour, returning `True` stops the reduction.
+        time_limit: Optional wall-clock budget in seconds.
+
+    Returns:
+        BKZ reduced basis with vectors in rows. With `return_profiles` tuple of the basis and matrix of shape `(tours + 1, m)`
+        with profiles $\log \|b^*_i\|$ of the LLL reduced input (first row) and of the basis after every tour.
+
+    Raises:
+        ValueError: If block size is smaller than 2.
+    '''
+    if block_size < 2:
+        raise ValueError(f"block size has to be at least 2, got {block_size}")
+
+    m = lattice_basis.shape[0]
+    if pruning is None:
+        pruning = block_size > _BKZ_PRUNING_BLOCK_SIZE
+    monitor = _Monitor.create(stats, callback, time_limit, None, None)
+    B = _lll(lattice_basis, delta, monitor)
+    profiles = [log_profile(B)]
+    best_slope, stalled, tours = np.inf, 0, 0
+    while (max_tours is None or tours < max_tours) and not (monitor is not None and monitor.stopped):
+        tours += 1
+        clean = True
+        for k in range(m - 1):
+            if monitor is not None and monitor.out_of_budget():
                 break
-        if not exists:
+            h = min(k + block_size, m)
+            norms, U = GSO_coefficients(B[:h])
+            if block_svp is None:
+                x = enumerate_block(U.T[k:h, k:h], norms[k:h], delta * norms[k], linear_pruning(h - k) if pruning else None)
+            else:
+                x = block_svp(U.T[k:h, k:h], norms[k:h], delta * norms[k])
+            if x is not None:
+                _insert_vector(B, x, k)
+                B[:h] = _lll(B[:h], delta, monitor)
+                clean = False
+                if monitor is not None:
+                    monitor.stats.insertions += 1
+
+        if monitor is not None and monitor.stopped:
+            break
+        if clean:
+            profiles.append(log_profile(B))
             break
+        # vectors past the changed blocks are size reduced (and Lovász condition restored) at the end of the tour
+        B = _lll(B, delta, monitor)
+        profiles.append(log_profile(B))
+        if monitor is not None:
+            monitor.stats.tours += 1
+            monitor.snapshot(profiles[-1])
+        if auto_abort:
+            # profile of reduced basis is roughly a line, it's slope (negative) gets flatter with better reduction
+            slope = -_slope(profiles[-1])
+            if slope < best_slope:
+                best_slope, stalled = slope, 0
+            else:
+                stalled += 1
+                if stalled >= _BKZ_AUTO_ABORT_TOURS:
+                    break
+
+    if monitor is not None:
+        monitor.finish(B)
+    if return_profiles:
+        return B, np.array(profiles)
     return B
 
 
+def log_profile(lattice_basis: Matrix) -> VectorFloat:
+    r'''Log-norm profile of the basis, i.e. vector of $\log \|b^*_i\|$ for the Gram-Schmidt vectors of the basis.
+
+    Args:
+        lattice_basis: Matrix with linearly independent basis vectors in rows.
+
+    Returns:
+        Vector of natural logarithms of norms of Gram-Schmidt vectors.
+    '''
+    norms, _ = GSO_coefficients(lattice_basis)
+    return 0.5 * np.log(norms)
+
+
+def linear_pruning(n: int) -> VectorFloat:
+    r'''Linear pruning coefficients of Gama-Nguyen-Regev for enumeration in dimension $n$: $\frac{d}{n}$ for depths $d = 1, \ldots, n$.
+
+    Args:
+        n: Dimension of enumerated lattice.
+
+    Returns:
+        Vector of length $n$ with pruning coefficients, bounds on partial squared lengths are these coefficients times squared radius.
+    '''
+    return np.arange(1, n + 1) / n
+
+
+def enumerate_block(mu: SquareMatrixFloat, norms: VectorFloat, radius: float, pruning: VectorFloat | None = None) -> VectorInt | None:
+    r'''Finds the shortest nonzero vector of the lattice given by it's Gram-Schmidt coefficients, with squared norm smaller than `radius`.
+
+    Vector $\sum_i x_i b_i$ has squared norm $\sum_i (x_i - c_i)^2 \|b^*_i\|^2$ with centers $c_i = -\sum_{j > i} x_j \mu_{j,i}$,
+    so coefficients are enumerated from the last one down to the first, keeping partial squared lengths of the fixed coefficients below the bound.
+    The enumeration tree is expanded level by level for whole sets of nodes at once with numpy's operations (instead of one node at a time),
+    nodes are ordered by their partial lengths (i.e. Schnorr-Euchner's order) and levels larger than an internal chunk size are processed depth first in chunks,
+    so the radius shrinks whenever a shorter vector is found and memory stays bounded.
+    Only one vector of each pair $\pm v$ is enumerated.
+    It's the enumeration engine of `BKZ` and of `enumeration.Enumeration`.
+
+    Args:
+        mu: Lower triangular matrix with $\mu_{i,j}$ for $j < i$.
+        norms: Squared norms $\|b^*_i\|^2$ of Gram-Schmidt vectors.
+        radius: Bound $R^2$ on squared norm of the vector.
+        pruning: Optional non-decreasing coefficients $p_d \in (0, 1]$ for depths $d = 1, \ldots, n$ (see `linear_pruning`),
+            partial squared length of the last $d$ coefficients is bounded by $p_d R^2$.
+
+    Returns:
+        Integer coefficients vector $x$ of the shortest found vector, or `None` if there is no (found) nonzero vector shorter than the radius.
+    '''
+    x, _, _ = _enumerate(mu, norms, None, radius, pruning)
+    return x
+
+
+def _enumerate(mu: SquareMatrixFloat, norms: VectorFloat, tau: VectorFloat | None, radius: float, pruning: VectorFloat | None) -> Tuple[VectorInt | None, float, int]:
+    r'''Enumeration of `enumerate_block`, for target with coordinates $\tau_i$ in the Gram-Schmidt basis (i.e. centers $c_i = \tau_i - \sum_{j > i} x_j \mu_{j,i}$),
+    or for the shortest nonzero vector if `tau` is `None`. Returns coefficients of the closest found vector, it's squared distance and the number of visited nodes.
+    '''
+    n = len(norms)
+    shortest = tau is None
+    tau = np.zeros(n) if shortest else np.asarray(tau, dtype=float)
+    p = np.ones(n) if pruning is None else np.asarray(pruning, dtype=float)
+    best, best_x, nodes = radius, None, 0
+    # stack of chunks of nodes (level, coefficients, partial lengths), coefficients with indices >= level are fixed
+    stack = [(n, np.zeros((1, n), dtype=int), np.zeros(1))]
+    while stack:
+        level, X, L = stack.pop()
+        i = level - 1
+        centers = tau[i] - X[:, level:] @ mu[level:, i]
+        remaining = best * p[n - 1 - i] - L
+        width = np.sqrt(np.maximum(remaining, 0.0) / norms[i])
+        low = np.ceil(centers - width).astype(int)
+        high = np.floor(centers + width).astype(int)
+        if shortest:
+            # for nodes with all coefficients so far zero enumerate only nonnegative x_i, which skips -v for every v
+            zero = ~X[:, level:].any(axis=1)
+            low[zero] = np.maximum(low[zero], 0)
+        counts = np.where(remaining >= 0, high - low + 1, 0).clip(min=0)
+        total = counts.sum()
+        if total == 0:
+            continue
+        if total > _ENUM_CHUNK and len(counts) > 1:
+            # too many children, the chunk is split and it's first half expanded first
+            half = len(counts) // 2
+            stack.append((level, X[half:], L[half:]))
+            stack.append((level, X[:half], L[:half]))
+            continue
+
+        nodes += total
+        parents = np.repeat(np.arange(len(counts)), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        X = X[parents]
+        X[:, i] = low[parents] + offsets
+        L = L[parents] + (X[:, i] - centers[parents]) ** 2 * norms[i]
+
+        if i == 0:
+            if shortest:
+                L[~X.any(axis=1)] = np.inf
+            j = np.argmin(L)
+            if L[j] < best:
+                best, best_x = L[j], X[j].copy()
+            continue
+
+        order = np.argsort(L, kind="stable")
+        X, L = X[order], L[order]
+        # the chunk with the shortest partial lengths is pushed last, so it's expanded first
+        for start in range((total - 1) // _ENUM_CHUNK * _ENUM_CHUNK, -1, -_ENUM_CHUNK):
+            stack.append((i, X[start:start + _ENUM_CHUNK], L[start:start + _ENUM_CHUNK]))
+
+    return best_x, best, nodes
+
+
+def _insert_vector(B: MatrixFloat, x: VectorInt, k: int) -> None:
+    r'''Replaces $b_k, \ldots, b_{k + \ell - 1}$ with their unimodular combination, such that the new $b_k$ is $\sum_i x_i b_{k + i}$ (in place).
+
+    Coefficients are eliminated from the last one with extended Euclidean algorithm on neighbouring pairs:
+    rows $b, b'$ with coefficients $x, x'$ are replaced with $\frac{x}{g} b + \frac{x'}{g} b'$ and $-t b + s b'$, where $g = sx + tx'$ is their gcd.
+    '''
+    x = [int(c) for c in x]
+    g = math.gcd(*x)
+    x = [c // g for c in x]
+    for i in range(len(x) - 1, 0, -1):
+        if x[i] == 0:
+            continue
+        g, s, t = integer_ring.eea(x[i - 1], x[i])
+        u, v = B[k + i - 1].copy(), B[k + i].copy()
+        B[k + i - 1] = (x[i - 1] // g) * u + (x[i] // g) * v
+        B[k + i] = -t * u + s * v
+        x[i - 1], x[i] = g, 0
+    if x[0] < 0:
+        B[k] = -B[k]
+
+
+class NearestPlaneDecoder:
+    r'''Babai's nearest plane algorithm with reduced basis and it's Gram-Schmidt coefficients precomputed once, for decoding many targets.
+
+    Target $t$ is written in Gram-Schmidt coordinates $\tau_i = \frac{\langle t, b^*_i \rangle}{\|b^*_i\|^2}$ and coefficients of the lattice vector are found by back substitution
+    $$
+    x_j = \left\lfloor \tau_j - \sum_{i > j} x_i \mu_{i,j} \right\rceil \quad \text{for } j = n - 1, \ldots, 0,
+    $$
+    each step done for the whole batch of targets at once.
+    Result is within distance $\frac{1}{2} \sqrt{\sum_i \|b^*_i\|^2}$ from the target and it's the closest vector when the target is within $\frac{1}{2} \min_i \|b^*_i\|$ from the lattice (BDD).
+
+    Attributes:
+        basis (MatrixFloat): LLL reduced basis with vectors in rows.
+        norms (VectorFloat): Squared norms of Gram-Schmidt vectors of the basis.
+        U (SquareMatrixFloat): Gram-Schmidt coefficients of the basis in the layout of `GSO_coefficients`.
+    '''
+    def __init__(self, lattice_basis: Matrix, delta: float = 0.75, reduce: bool = True) -> None:
+        r'''Reduces the basis and computes it's Gram-Schmidt coefficients.
+
+        Args:
+            lattice_basis: Matrix with linearly independent basis vectors in rows.
+            delta: Parameter of Lovász condition for LLL reduction.
+            reduce: Whether to LLL reduce the basis, `False` keeps the (already reduced) basis as it is.
+        '''
+        self.basis = LLL(lattice_basis, delta) if reduce else lattice_basis.astype(float)
+        self.norms, self.U = GSO_coefficients(self.basis)
+
+
+    def coefficients(self, targets: Vector | Matrix) -> VectorInt | MatrixInt:
+        r'''Coefficients (with respect to `basis`) of lattice vectors found for the targets.
+
+        Args:
+            targets: Target vector or matrix of shape `(k, n)` with targets in rows.
+
+        Returns:
+            Integer vector or matrix of shape `(k, m)` with coefficients in rows.
+        '''
+        T = np.atleast_2d(np.asarray(targets, dtype=float))
+        # Gram-Schmidt coordinates of all targets from B t = U^T B* t
+        tau = np.linalg.solve(self.U.T, self.basis @ T.T) / self.norms[:, np.newaxis]
+        mu = self.U.T
+        m = len(self.norms)
+        X = np.zeros_like(tau)
+        for j in range(m - 1, -1, -1):
+            X[j] = np.rint(tau[j] - mu[j + 1:, j] @ X[j + 1:])
+        X = X.T.astype(int)
+        return X if np.ndim(targets) == 2 else X[0]
+
+
+    def decode(self, targets: Vector | Matrix) -> VectorFloat | MatrixFloat:
+        r'''Finds lattice vectors close to the targets.
+
+        Args:
+            targets: Target vector or matrix of shape `(k, n)` with targets in rows.
+
+        Returns:
+            Lattice vector or matrix of shape `(k, n)` with lattice vectors in rows.
+        '''
+        return self.coefficients(targets) @ self.basis
+
+
 def babai_nearest_plane(lattice_basis: SquareMatrix, w: VectorFloat):
-    r'''
+    r'''Babai's nearest plane algorithm on LLL reduced (with $\delta = 0.75$) basis, see `NearestPlaneDecoder`.
+    For many targets in the same lattice construct the decoder once instead.
 
     Args:
+        lattice_basis: Matrix with basis vectors in rows.
+        w: Target vector.
 
     Returns:
-    
+        Lattice vector close to the target.
     '''
-    n = lattice_basis.shape[0]
-    B = LLL(lattice_basis, 0.75)
-    b = w.astype(float)
-    for j in range(n - 1, -1, -1):
-        Bstar, _ = GSO(B)
-        cj = round(np.dot(b, Bstar[j]) / np.dot(Bstar[j], Bstar[j]))
-        b = b - cj * B[j]
-    return w - b
+    return NearestPlaneDecoder(lattice_basis, 0.75).decode(w)
 
 
 
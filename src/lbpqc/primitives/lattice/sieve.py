@@ -0,0 +1,132 @@
+from lbpqc.type_aliases import *
+from lbpqc.primitives.lattice.reductions import LLL, GSO_coefficients
+
+
+# default bound on the memory taken by the list of `gauss_sieve`, in bytes
+SIEVE_MEMORY_LIMIT = 1 << 30
+
+# number of samples drawn from the discrete Gaussian at once
+_SAMPLE_BATCH = 256
+
+
+def gauss_sieve(lattice_basis: Matrix, memory_limit: int = SIEVE_MEMORY_LIMIT, max_collisions: int | None = None, seed: int | None = None) -> VectorFloat:
+    r'''Heuristic SVP solver, Gauss sieve of Micciancio-Voulgaris.
+
+    Sieve keeps a list of pairwise Gauss reduced lattice vectors, i.e. $|\langle u, v \rangle| \le \frac{1}{2} \min(\|u\|^2, \|v\|^2)$.
+    New vector (popped from the stack or sampled from a discrete Gaussian over the lattice with Klein's algorithm) is first reduced with shorter list vectors,
+    and then reduces the longer ones, which are removed from the list and pushed to the stack.
+    Vector reduced to zero counts as a collision and the sieve stops after enough of them, when the shortest list vector is (heuristically) the shortest lattice vector.
+
+    List vectors are rows of one contiguous, preallocated buffer with their squared norms in another one,
+    so a new vector is tested against the whole list with a single matrix-vector product of inner products.
+    Both tests and reductions are vectorized, only the choice of the next reducing vector is sequential.
+    Input basis is LLL reduced first and it's vectors seed the list.
+    When the list would exceed `memory_limit` bytes the sieve stops early with the shortest vector found so far.
+
+    Args:
+        lattice_basis: Matrix with linearly independent basis vectors in rows.
+        memory_limit: Bound on the size of the list's buffer in bytes.
+        max_collisions: Number of collisions after which the sieve stops, defaults to $\frac{|L|}{10} + 200$ for the current list $L$.
+        seed: Seed of the sampler's random generator.
+
+    Returns:
+        The shortest nonzero vector found.
+    '''
+    B = LLL(lattice_basis, 0.99)
+    m, n = B.shape
+    norms, U = GSO_coefficients(B)
+    rng = np.random.default_rng(seed)
+
+    capacity = max(memory_limit // (8 * (n + 1)), m)
+    L = np.empty((capacity, n))
+    L_norms = np.empty(capacity)
+    size = 0
+    stack = [b for b in B]
+    samples = []
+    # Klein's sampler with parameter s = ||b_0|| rounds centers with noise of deviation s / ||b*_i||
+    deviations = np.sqrt(norms[0] / norms) / np.sqrt(2 * np.pi)
+
+    collisions = 0
+    while collisions < (size // 10 + 200 if max_collisions is None else max_collisions):
+        if stack:
+            p = stack.pop()
+        else:
+            if not samples:
+                samples = list(_klein_samples(B, U.T, deviations, rng))
+            p = samples.pop()
+        p = p.copy()
+        p_norm = p @ p
+
+        # reduction of the new vector with the list, the best reduction first, until no list vector reduces it
+        while size != 0 and p_norm > 0:
+            products = L[:size] @ p
+            k = np.rint(products / L_norms[:size])
+            gains = k * (2 * products - k * L_norms[:size])
+            j = np.argmax(gains)
+            if gains[j] <= 1e-9 * p_norm:
+                break
+            p -= k[j] * L[j]
+            p_norm = p @ p
+
+        if p_norm <= 1e-9 * norms[0]:
+            collisions += 1
+            continue
+
+        # longer list vectors reduced by the new one are moved to the stack
+        if size != 0:
+            products = L[:size] @ p
+            reducible = (L_norms[:size] > p_norm) & (2 * np.abs(products) > p_norm)
+            if np.any(reducible):
+                k = np.rint(products[reducible] / p_norm)
+                for v in L[:size][reducible] - k[:, np.newaxis] * p:
+                    if v @ v > 1e-9 * norms[0]:
+                        stack.append(v)
+                    else:
+                        collisions += 1
+                keep = ~reducible
+                kept = np.count_nonzero(keep)
+                L[:kept] = L[:size][keep]
+                L_norms[:kept] = L_norms[:size][keep]
+                size = kept
+
+        if size == capacity:
+            break
+        L[size] = p
+        L_norms[size] = p_norm
+        size += 1
+
+    return L[np.argmin(L_norms[:size])].copy()
+
+
+def sieve_block(mu: SquareMatrixFloat, norms: VectorFloat, radius: float, memory_limit: int = SIEVE_MEMORY_LIMIT) -> VectorInt | None:
+    r'''Finds short vector of the lattice given by it's Gram-Schmidt coefficients with `gauss_sieve`, it's a drop-in replacement of `reductions.enumerate_block`,
+    e.g. for large blocks of `reductions.BKZ` (see it's `block_svp` argument).
+
+    Sieve runs on the basis in Gram-Schmidt coordinates, i.e. on the lower triangular matrix with rows $\mu_{i,j} \|b^*_j\|$.
+
+    Args:
+        mu: Lower triangular matrix with $\mu_{i,j}$ for $j < i$.
+        norms: Squared norms $\|b^*_i\|^2$ of Gram-Schmidt vectors.
+        radius: Bound $R^2$ on squared norm of the vector.
+        memory_limit: Bound on the size of the sieve's list in bytes.
+
+    Returns:
+        Integer coefficients vector $x$ of the found vector, or `None` if the found vector isn't shorter than the radius.
+    '''
+    n = len(norms)
+    M = np.tril(mu, -1) + np.identity(n)
+    M = M * np.sqrt(norms)[np.newaxis, :]
+    v = gauss_sieve(M, memory_limit)
+    if v @ v >= radius:
+        return None
+    return np.rint(np.linalg.solve(M.T, v)).astype(int)
+
+
+def _klein_samples(B: MatrixFloat, mu: SquareMatrixFloat, deviations: VectorFloat, rng: np.random.Generator) -> MatrixFloat:
+    r'''Batch of lattice vectors sampled with Klein's algorithm (with rounded continuous noise), all samples of the batch are computed level by level at once.'''
+    m = B.shape[0]
+    X = np.zeros((_SAMPLE_BATCH, m))
+    for i in range(m - 1, -1, -1):
+        centers = -(X[:, i + 1:] @ mu[i + 1:, i])
+        X[:, i] = np.rint(centers + deviations[i] * rng.standard_normal(_SAMPLE_BATCH))
+    return X @ B
@@ -1,3 +1,5 @@
 from lbpqc.primitives.polynomial.modpoly import ModIntPolyRing
-from lbpqc.primitives.polynomial.polyqring import PolyQuotientRing, construct_ring
+from lbpqc.primitives.polynomial.ntt import NTT
+from lbpqc.primitives.polynomial.polyqring import PolyQuotientRing, RingElement, construct_ring
+from lbpqc.primitives.polynomial.module import ModuleMatrix
 import lbpqc.primitives.polynomial.poly as poly
\ No newline at end of file
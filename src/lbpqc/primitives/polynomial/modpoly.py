@@ -3,6 +3,80 @@ import lbpqc.primitives.polynomial.poly as poly
 from lbpqc.primitives.integer.integer_ring import modinv
 
 
+r'''
+Euclidean division switches from long division to division through Newton iteration on reversed power series,
+when both the degree of the divisor and the degree of the quotient are at least `NEWTON_DIVISION_THRESHOLD`
+(or a quarter of it, when the power series inverse of the divisor is already cached).
+'''
+NEWTON_DIVISION_THRESHOLD = 256
+
+r'''
+Extended Euclidean algorithm uses half-GCD for polynomials of degree at least `HGCD_THRESHOLD`,
+below it the classical remainder sequence is faster.
+'''
+HGCD_THRESHOLD = 64
+
+
+def _deg(p: VectorModInt) -> int:
+    r'''Degree of trimmed coefficients' array.'''
+    return len(p) - 1 if p[-1] != 0 else -1
+
+
+def _shift(p: VectorModInt, k: int) -> VectorModInt:
+    r'''Quotient of trimmed polynomial divided by $X^k$.'''
+    return p[k:] if len(p) > k else poly.zero_poly()
+
+
+def _long_div(a: VectorModInt, b: VectorModInt, m: int) -> Tuple[VectorModInt, VectorModInt]:
+    r'''In-place long division of reduced and trimmed polynomials, with the inverse of the leading coefficient computed once.'''
+    n, d = len(a) - 1, len(b) - 1
+    if n < d:
+        return poly.zero_poly(), a
+
+    # int64 products of reduced coefficients overflow for moduli above 2^31
+    dtype = int if m < 2 ** 31 else object
+    r = a.astype(dtype)
+    b = b.astype(dtype)
+    q = np.zeros(n - d + 1, dtype=dtype)
+    lc_inv = modinv(int(b[d]), m)
+    for k in range(n, d - 1, -1):
+        if c := (r[k] * lc_inv) % m:
+            q[k - d] = c
+            r[k - d:k + 1] -= c * b
+            r[k - d:k + 1] %= m
+
+    return poly._trim(poly._narrow(q), copy=False), poly._trim(poly._narrow(r[:max(d, 1)]), copy=False)
+
+
+r'''
+Unchecked arithmetic on reduced and trimmed polynomials, used in the inner loops of the extended Euclidean algorithm.
+'''
+def _add(a: VectorModInt, b: VectorModInt, m: int) -> VectorModInt:
+    if len(a) < len(b):
+        a, b = b, a
+    r = a.copy()
+    r[:len(b)] += b
+    return poly._trim(np.remainder(r, m, out=r), copy=False)
+
+
+def _sub(a: VectorModInt, b: VectorModInt, m: int) -> VectorModInt:
+    r = poly.to_dense(a, max(len(a), len(b)))
+    r[:len(b)] -= b
+    return poly._trim(np.remainder(r, m, out=r), copy=False)
+
+
+def _mul(a: VectorModInt, b: VectorModInt, m: int) -> VectorModInt:
+    n = min(len(a), len(b))
+    if n <= poly.INT64_FFT_THRESHOLD and 2 * (m - 1).bit_length() + n.bit_length() < 63:
+        r = np.convolve(a, b)
+        return poly._trim(np.remainder(r, m, out=r), copy=False)
+    return poly._trim(poly.mul(a, b, m), copy=False)
+
+
+def _identity() -> Tuple:
+    return (poly.monomial(1, 0), poly.zero_poly(), poly.zero_poly(), poly.monomial(1, 0))
+
+
 class ModIntPolyRing:
     r'''This class implements operations over $\mathbb{Z}_p[X]$ polynomial ring, i.e. polynomials which coefficients are reduced modulo $p$.
 
@@ -23,6 +97,7 @@ class ModIntPolyRing:
         '''
         if modulus <= 1: raise ValueError("Modulus has to be greater than 1")
         self.modulus = modulus
+        self._reciprocals = {}
 
     
     @enforce_type_check
@@ -36,7 +111,7 @@ class ModIntPolyRing:
         Returns:
             Array of coefficients reduced modulo **modulus**.
         '''
-        return poly.trim(polynomial % self.modulus)
+        return poly._trim(polynomial % self.modulus, copy=False)
     
 
     @enforce_type_check
@@ -80,7 +155,9 @@ class ModIntPolyRing:
             Coefficients array of polynomial $a + b$.
         '''
 
-        return self.reduce(poly.add(polynomial_a, polynomial_b))
+        r = poly.to_dense(polynomial_a, max(len(polynomial_a), len(polynomial_b)))
+        r[:len(polynomial_b)] += polynomial_b
+        return poly._trim(np.remainder(r, self.modulus, out=r), copy=False)
 
     @enforce_type_check
     def sub(self, polynomial_a: VectorInt, polynomial_b: VectorInt) -> VectorModInt:
@@ -93,9 +170,10 @@ class ModIntPolyRing:
         Returns:
             Coefficients array of polynomial $a - b$.
         '''
-        
 
-        return self.reduce(poly.sub(polynomial_a, polynomial_b))
+        r = poly.to_dense(polynomial_a, max(len(polynomial_a), len(polynomial_b)))
+        r[:len(polynomial_b)] -= polynomial_b
+        return poly._trim(np.remainder(r, self.modulus, out=r), copy=False)
         
 
     @enforce_type_check
@@ -110,7 +188,7 @@ class ModIntPolyRing:
             Coefficients array of polynomial $a \cdot b$.
         '''
 
-        return self.reduce(poly.mul(polynomial_a, polynomial_b))
+        return poly._trim(poly.mul(polynomial_a, polynomial_b, self.modulus), copy=False)
 
 
     @enforce_type_check
@@ -127,17 +205,63 @@ class ModIntPolyRing:
 
         if self.is_zero(polynomial_b): raise ZeroDivisionError("Can't divide by zero polynomial")
 
-        q = poly.zero_poly()
-        r = self.reduce(polynomial_a)
+        a = self.reduce(polynomial_a)
+        b = self.reduce(polynomial_b)
+        n, d = len(a) - 1, len(b) - 1
+        if n < d or poly.is_zero_poly(a):
+            return poly.zero_poly(), a
 
-        d = self.deg(polynomial_b)
-        c = polynomial_b[d]
-        while (dr := self.deg(r)) >= d:
-            s = poly.monomial(r[dr] * modinv(c, self.modulus), dr - d)
-            q = self.add(q, s)
-            r = self.sub(r, self.mul(s, polynomial_b))
-        
-        return q, r
+        # reciprocal of the divisor is cached, when dividing repeatedly by the same polynomial, which makes Newton division cheaper
+        threshold = NEWTON_DIVISION_THRESHOLD // 4 if b.tobytes() in self._reciprocals else NEWTON_DIVISION_THRESHOLD
+        if min(d, n - d) >= threshold:
+            q = poly.to_dense(poly.mul(a[::-1][:n - d + 1], self._reversed_reciprocal(b, n - d + 1), self.modulus)[:n - d + 1], n - d + 1)[::-1]
+            r = a[:d] - poly.to_dense(poly.mul(q, b, self.modulus)[:d], d)
+            return poly._trim(q), self.reduce(r) if d > 0 else poly.zero_poly()
+
+        return _long_div(a, b, self.modulus)
+
+
+    @enforce_type_check
+    def power_series_inv(self, polynomial: VectorInt, precision: int) -> VectorModInt:
+        r'''Computes inverse of the polynomial treated as a power series truncated at $X^{\text{precision}}$, i.e. polynomial $h$ such that
+        $$
+        f \cdot h \equiv 1 \mod X^{\text{precision}}
+        $$
+        using Newton iteration $h \leftarrow h (2 - f h)$, that doubles the precision at every step.
+
+        Args:
+            polynomial: Coefficients array of power series $f$, $f(0)$ has to be invertible modulo **modulus**.
+            precision: Number of coefficients of the inverse to compute.
+
+        Returns:
+            Coefficients array of length `precision` (not trimmed).
+
+        Raises:
+            ValueError: If $f(0)$ is not invertible modulo **modulus**.
+        '''
+        m = self.modulus
+        f = poly.to_dense(polynomial[:precision] % m, precision)
+        h = np.array([modinv(int(f[0]), m)], dtype=int)
+        k = 1
+        while k < precision:
+            k = min(2 * k, precision)
+            e = poly.to_dense(poly.mul(f[:k], h, m)[:k], k)
+            e = (-e) % m
+            e[0] = (e[0] + 2) % m
+            h = poly.to_dense(poly.mul(h, e, m)[:k], k)
+        return h
+
+
+    def _reversed_reciprocal(self, polynomial: VectorModInt, precision: int) -> VectorModInt:
+        r'''Power series inverse of the reversed (trimmed) polynomial, cached for the few most recently used divisors.'''
+        key = polynomial.tobytes()
+        h = self._reciprocals.get(key)
+        if h is None or len(h) < precision:
+            h = self.power_series_inv(polynomial[::-1].copy(), precision)
+            if len(self._reciprocals) >= 8:
+                self._reciprocals.pop(next(iter(self._reciprocals)))
+            self._reciprocals[key] = h
+        return h[:precision]
 
 
     @enforce_type_check
@@ -191,6 +315,9 @@ class ModIntPolyRing:
         r1 = self.reduce(polynomial_b)
         if poly.deg(r1) > poly.deg(r0):
             r0, r1 = r1, r0
+
+        if _deg(r1) >= HGCD_THRESHOLD:
+            return self.eea(r0, r1)[0]
         
         while not self.is_zero(r1):
             r0, r1 = r1, self.rem(r0, r1)
@@ -218,6 +345,10 @@ class ModIntPolyRing:
     def eea(self, polynomial_a: VectorInt, polynomial_b: VectorInt) -> Tuple[VectorModInt, VectorModInt, VectorModInt]:
         r'''Extended Euclidean algorithm for polynomials, e.i algorithm that calculates coefficients for **Bézout's identity**.
 
+        For polynomials of degree at least `HGCD_THRESHOLD` the remainder sequence is computed with the half-GCD algorithm,
+        which jumps over half of the remainder sequence using only the top halves of the coefficients,
+        so the cost is $O(M(n) \log n)$ instead of quadratic. The result is the same as for the classical algorithm.
+
         Args:
             polynomial_a: Coefficients array of polynomial $a$.
             polynomial_b: Coefficients array of polynomial $b$.
@@ -228,15 +359,130 @@ class ModIntPolyRing:
         '''
         
         f0, f1 = self.reduce(polynomial_a), self.reduce(polynomial_b)
-        a0, a1 = poly.monomial(1, 0), poly.zero_poly()
-        b0, b1 = poly.zero_poly(), poly.monomial(1, 0)
-
-        while not self.is_zero(f1):
+        M = _identity()
+
+        # half-GCD requires deg f0 > deg f1
+        if _deg(f1) >= 0 and _deg(f0) <= _deg(f1):
+            f0, f1, M = self._euclid_step(f0, f1, M)
+
+        while _deg(f1) >= 0:
+            if _deg(f1) >= HGCD_THRESHOLD:
+                R = self._hgcd(f0, f1)
+                f0, f1 = self._mat_apply(R, f0, f1)
+                M = self._mat_mul(R, M)
+                if _deg(f1) < 0:
+                    break
+            f0, f1, M = self._euclid_step(f0, f1, M)
+
+        return f0, M[0], M[1]
+
+
+    def _euclid_step(self, f0: VectorModInt, f1: VectorModInt, M: Tuple) -> Tuple:
+        r'''Single step of the remainder sequence $(f_0, f_1) \to (f_1, f_0 \bmod f_1)$, with transformation matrix updated accordingly.'''
+        m = self.modulus
+        if _deg(f0) - _deg(f1) < NEWTON_DIVISION_THRESHOLD // 4:
+            q, r = _long_div(f0, f1, m)
+        else:
             q, r = self.euclidean_div(f0, f1)
+        return f1, r, (M[2], M[3], _sub(M[0], _mul(q, M[2], m), m), _sub(M[1], _mul(q, M[3], m), m))
 
-            f0, f1 = f1, r
 
-            a0, a1 = a1, self.sub(a0, self.mul(q, a1))
-            b0, b1 = b1, self.sub(b0, self.mul(q, b1))
-    
-        return f0, a0, b0
\ No newline at end of file
+    def _mat_mul(self, A: Tuple, B: Tuple) -> Tuple:
+        r'''Product of 2x2 matrices of polynomials stored row-major as 4-tuples.'''
+        m = self.modulus
+        return (
+            _add(_mul(A[0], B[0], m), _mul(A[1], B[2], m), m),
+            _add(_mul(A[0], B[1], m), _mul(A[1], B[3], m), m),
+            _add(_mul(A[2], B[0], m), _mul(A[3], B[2], m), m),
+            _add(_mul(A[2], B[1], m), _mul(A[3], B[3], m), m),
+        )
+
+
+    def _mat_apply(self, M: Tuple, f0: VectorModInt, f1: VectorModInt) -> Tuple[VectorModInt, VectorModInt]:
+        m = self.modulus
+        return _add(_mul(M[0], f0, m), _mul(M[1], f1, m), m), _add(_mul(M[2], f0, m), _mul(M[3], f1, m), m)
+
+
+    def _hgcd(self, a: VectorModInt, b: VectorModInt) -> Tuple:
+        r'''Half-GCD: for $\deg a > \deg b$ returns transformation matrix $M$ of the remainder sequence,
+        such that $(c, d) = M (a, b)$ are consecutive remainders with $\deg d < \lceil \deg a / 2 \rceil \leq \deg c$.
+        '''
+        m = (_deg(a) + 1) // 2
+        if _deg(b) < m:
+            return _identity()
+
+        if _deg(a) < HGCD_THRESHOLD:
+            M = _identity()
+            while _deg(b) >= m:
+                a, b, M = self._euclid_step(a, b, M)
+            return M
+
+        # quotients of the first half of the sequence depend only on the top coefficients
+        R = self._hgcd(_shift(a, m), _shift(b, m))
+        a, b = self._mat_apply(R, a, b)
+        if _deg(b) < m:
+            return R
+
+        a, b, R = self._euclid_step(a, b, R)
+        if _deg(b) < m:
+            return R
+
+        k = 2 * m - _deg(a)
+        return self._mat_mul(self._hgcd(_shift(a, k), _shift(b, k)), R)
+
+    @enforce_type_check
+    def batch_reduce(self, polynomials: MatrixInt) -> MatrixModInt:
+        r'''Reduces coefficients of a batch of polynomials modulo **modulus**.
+        Batch is a matrix of shape `(batch, N)` with polynomials' coefficients in rows, rows are not trimmed.
+
+        Args:
+            polynomials: Matrix with polynomials' coefficients in rows.
+
+        Returns:
+            Matrix of the same shape with coefficients reduced modulo **modulus**.
+        '''
+        return polynomials % self.modulus
+
+
+    @enforce_type_check
+    def batch_add(self, polynomials_a: MatrixInt, polynomials_b: MatrixInt) -> MatrixModInt:
+        r'''Adds two batches of polynomials row by row.
+
+        Args:
+            polynomials_a: Matrix with polynomials' $a_i$ coefficients in rows.
+            polynomials_b: Matrix with polynomials' $b_i$ coefficients in rows.
+
+        Returns:
+            Matrix with coefficients of polynomials $a_i + b_i$ in rows.
+        '''
+        R = poly.batch_add(polynomials_a, polynomials_b)
+        return np.remainder(R, self.modulus, out=R)
+
+
+    @enforce_type_check
+    def batch_sub(self, polynomials_a: MatrixInt, polynomials_b: MatrixInt) -> MatrixModInt:
+        r'''Subtracts batch of polynomials $b$ from batch $a$ row by row.
+
+        Args:
+            polynomials_a: Matrix with polynomials' $a_i$ coefficients in rows.
+            polynomials_b: Matrix with polynomials' $b_i$ coefficients in rows.
+
+        Returns:
+            Matrix with coefficients of polynomials $a_i - b_i$ in rows.
+        '''
+        R = poly.batch_sub(polynomials_a, polynomials_b)
+        return np.remainder(R, self.modulus, out=R)
+
+
+    @enforce_type_check
+    def batch_mul(self, polynomials_a: MatrixInt, polynomials_b: MatrixInt) -> MatrixModInt:
+        r'''Multiplies two batches of polynomials row by row.
+
+        Args:
+            polynomials_a: Matrix with polynomials' $a_i$ coefficients in rows.
+            polynomials_b: Matrix with polynomials' $b_i$ coefficients in rows.
+
+        Returns:
+            Matrix with coefficients of polynomials $a_i \cdot b_i$ in rows.
+        '''
+        return poly.batch_mul(polynomials_a, polynomials_b, self.modulus)
@@ -0,0 +1,187 @@
+from lbpqc.type_aliases import *
+
+from lbpqc.primitives.polynomial.polyqring import PolyQuotientRing
+
+
+r'''
+Module over polynomial quotient ring $R_q = \frac{\mathbb{Z}_q[X]}{q(X)}$.
+
+Vector of $m$ ring elements is represented as numpy's array of shape `(m, N)` with dense coefficients of the elements in rows,
+matrix of $k \times \ell$ ring elements as array of shape `(k, l, N)`.
+'''
+
+
+class ModuleMatrix:
+    r'''Matrix $A \in R_q^{k \times \ell}$ over polynomial quotient ring, e.g. public matrix of Module-LWE.
+
+    Coefficients are kept as a single array of shape `(k, l, N)`. For rings with NTT engine transform of the whole matrix is computed once (lazily) and cached,
+    so that matrix-vector products are batched pointwise multiply-accumulate in the evaluation domain:
+    $k \cdot \ell$ pointwise products, but only $\ell$ forward and $k$ inverse transforms.
+    Other rings multiply all entries with single call of `PolyQuotientRing.batch_mul`.
+
+    Attributes:
+        ring (PolyQuotientRing): Ring of matrix's entries.
+        coefficients (np.ndarray): Array of shape `(k, l, N)` with reduced coefficients of entries.
+    '''
+    def __init__(self, ring: PolyQuotientRing, coefficients: np.ndarray) -> None:
+        r'''Constructs module matrix from array of entries' coefficients.
+
+        Args:
+            ring: Ring of matrix's entries.
+            coefficients: Integer array of shape `(k, l, L)` with coefficients of entries along the last axis, entries are reduced in the ring.
+        '''
+        self.ring = ring
+        self.coefficients = reduce(ring, coefficients)
+        self._transform = None
+
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        r'''Dimensions $(k, \ell)$ of the matrix.'''
+        return self.coefficients.shape[:2]
+
+
+    @property
+    def transform(self) -> np.ndarray:
+        r'''NTT transforms of all entries, array of shape `(k, l, N)`. Computed on first access and cached.
+
+        Raises:
+            ValueError: If ring has no NTT engine.
+        '''
+        if self._transform is None:
+            if self.ring.ntt is None:
+                raise ValueError("ring does not support NTT")
+            self._transform = self.ring.ntt.forward(self.coefficients)
+        return self._transform
+
+
+    def transpose(self) -> "ModuleMatrix":
+        r'''Returns transposed matrix $A^T$ (with cached transform carried over).'''
+        T = ModuleMatrix.__new__(ModuleMatrix)
+        T.ring = self.ring
+        T.coefficients = self.coefficients.transpose(1, 0, 2).copy()
+        T._transform = None if self._transform is None else self._transform.transpose(1, 0, 2).copy()
+        return T
+
+
+    def _products(self, A: np.ndarray, A_hat: np.ndarray | None, vector: np.ndarray) -> np.ndarray:
+        r'''Computes $\sum_j A_{ij} v_j$ for entries' coefficients `A` of shape `(k, l, N)` and module vector of shape `(l, N)`.'''
+        ring, q = self.ring, self.ring.int_modulus
+        if ring.ntt is not None:
+            products = ring.ntt.pointwise_mul(A_hat, ring.ntt.forward(vector)[np.newaxis, :, :])
+            return ring.ntt.inverse(products.sum(axis=1) % q)
+
+        k, l, N = A.shape
+        V = np.broadcast_to(vector[np.newaxis, :, :], (k, l, N)).reshape(k * l, N)
+        products = ring.batch_mul(A.reshape(k * l, N), V).reshape(k, l, N)
+        return products.sum(axis=1) % q
+
+
+    def matvec(self, vector: np.ndarray) -> np.ndarray:
+        r'''Multiplies the matrix by module vector, i.e. computes $A v$.
+
+        Args:
+            vector: Array of shape `(l, N)` with coefficients of vector's entries.
+
+        Returns:
+            Array of shape `(k, N)` with coefficients of entries of $A v$.
+        '''
+        v = reduce(self.ring, vector)
+        return self._products(self.coefficients, self.transform if self.ring.ntt is not None else None, v)
+
+
+    def rmatvec(self, vector: np.ndarray) -> np.ndarray:
+        r'''Multiplies transposed matrix by module vector, i.e. computes $A^T v$, without materializing the transposition.
+
+        Args:
+            vector: Array of shape `(k, N)` with coefficients of vector's entries.
+
+        Returns:
+            Array of shape `(l, N)` with coefficients of entries of $A^T v$.
+        '''
+        v = reduce(self.ring, vector)
+        A_hat = self.transform.transpose(1, 0, 2) if self.ring.ntt is not None else None
+        return self._products(self.coefficients.transpose(1, 0, 2), A_hat, v)
+
+
+    def __add__(self, other: "ModuleMatrix") -> "ModuleMatrix":
+        return ModuleMatrix(self.ring, self.coefficients + other.coefficients)
+
+
+    def __sub__(self, other: "ModuleMatrix") -> "ModuleMatrix":
+        return ModuleMatrix(self.ring, self.coefficients - other.coefficients)
+
+
+    def rotation_matrix(self) -> MatrixModInt:
+        r'''Expands the matrix into integer matrix $M$ of shape $(\ell N, k N)$ made of rotation matrices of entries (see `PolyQuotientRing.rotation_matrix`),
+        such that for module vector $v$ flattened coefficients of $A v$ are equal to the flattened coefficients of $v$ multiplied by $M$ (modulo $q$).
+        It's the lattice basis block used in attacks on Module-LWE.
+
+        Returns:
+            Integer matrix of shape `(l * N, k * N)`.
+        '''
+        ring, q = self.ring, self.ring.int_modulus
+        k, l, N = self.coefficients.shape
+        if ring.family in ("cyclic", "negacyclic"):
+            # all k * l circulant blocks gathered with one index array
+            shifts = np.arange(N)[np.newaxis, :] - np.arange(N)[:, np.newaxis]
+            blocks = self.coefficients[:, :, shifts % N]
+            if ring.family == "negacyclic":
+                blocks[:, :, shifts < 0] *= -1
+            blocks %= q
+        else:
+            blocks = np.array([[ring.rotation_matrix(self.coefficients[i, j]) for j in range(l)] for i in range(k)])
+
+        # block (j, i) of M is the rotation matrix of A_ij
+        return blocks.transpose(1, 2, 0, 3).reshape(l * N, k * N)
+
+
+def reduce(ring: PolyQuotientRing, elements: np.ndarray) -> np.ndarray:
+    r'''Reduces array of ring elements' coefficients (along the last axis) of any shape in the ring.
+
+    Args:
+        ring: Polynomial quotient ring.
+        elements: Integer array of shape `(..., L)`.
+
+    Returns:
+        Array of shape `(..., N)` with reduced coefficients.
+    '''
+    elements = np.asarray(elements)
+    lead = elements.shape[:-1]
+    if ring.family is not None:
+        return ring._fold(elements)
+    return ring.batch_reduce(elements.reshape(-1, elements.shape[-1])).reshape(lead + (ring.N,))
+
+
+def compress(elements: np.ndarray, d: int, q: int) -> np.ndarray:
+    r'''Compression of coefficients from $\mathbb{Z}_q$ to $d$ bits, elementwise
+    $$
+    x \mapsto \left\lceil \frac{2^d}{q} x \right\rfloor \bmod 2^d
+    $$
+
+    Args:
+        elements: Integer array with entries from $[0, q)$.
+        d: Number of bits.
+        q: Integer modulus.
+
+    Returns:
+        Array of the same shape with entries from $[0, 2^d)$.
+    '''
+    return (((elements % q) << d) + q // 2) // q % (1 << d)
+
+
+def decompress(elements: np.ndarray, d: int, q: int) -> np.ndarray:
+    r'''Decompression of $d$-bit coefficients back to $\mathbb{Z}_q$, elementwise
+    $$
+    x \mapsto \left\lceil \frac{q}{2^d} x \right\rfloor
+    $$
+
+    Args:
+        elements: Integer array with entries from $[0, 2^d)$.
+        d: Number of bits.
+        q: Integer modulus.
+
+    Returns:
+        Array of the same shape with entries from $[0, q)$.
+    '''
+    return ((elements * q + (1 << (d - 1))) >> d) % q
@@ -0,0 +1,214 @@
+from lbpqc.type_aliases import *
+
+from lbpqc.primitives.integer import integer_ring, prime
+
+
+class NTT:
+    r'''Number theoretic transform for rings
+    $$
+    \frac{\mathbb{Z}_q[X]}{X^N - 1} \quad \text{and} \quad \frac{\mathbb{Z}_q[X]}{X^N + 1}
+    $$
+    with prime $q < 2^{31}$ and $N$ being a power of two, such that $q \equiv 1 \pmod N$ (cyclic case) or $q \equiv 1 \pmod {2N}$ (negacyclic case).
+
+    Transform evaluates polynomial at the $N$ roots of the polynomial modulus, so multiplication in the ring becomes pointwise multiplication of the transforms.
+    Negacyclic transform is the cyclic one applied to $a(\psi X)$ for a primitive $2N$-th root of unity $\psi$.
+
+    Transforms are iterative radix-2 Cooley-Tukey butterflies vectorized over whole stages, all twiddle factors are computed once in the constructor.
+    All methods work on arrays of shape `(..., N)`, so batches of polynomials are transformed at once.
+
+    Attributes:
+        N (int): Length of the transform.
+        q (int): Prime integer modulus.
+        negacyclic (bool): `True` for $X^N + 1$ modulus, `False` for $X^N - 1$.
+    '''
+    def __init__(self, N: int, q: int, negacyclic: bool = True) -> None:
+        r'''Computes twiddle tables for the transform.
+
+        Args:
+            N: Length of the transform, power of two.
+            q: Prime integer modulus.
+            negacyclic: Whether transform is for $X^N + 1$ (`True`) or $X^N - 1$ (`False`) modulus.
+
+        Raises:
+            ValueError: If parameters don't admit the transform (see `is_supported`).
+        '''
+        if not NTT.is_supported(N, q, negacyclic):
+            raise ValueError(f"NTT of length {N} modulo {q} is not supported for {'negacyclic' if negacyclic else 'cyclic'} ring")
+
+        self.N = N
+        self.q = q
+        self.negacyclic = negacyclic
+
+        order = 2 * N if negacyclic else N
+        root = pow(_generator(q), (q - 1) // order, q)
+        omega = pow(root, 2, q) if negacyclic else root
+        omega_inv = integer_ring.modinv(omega, q)
+
+        # bit reversal permutation of input indices
+        bits = N.bit_length() - 1
+        self._rev = np.array([int(format(i, f"0{bits}b")[::-1], 2) if bits > 0 else 0 for i in range(N)], dtype=int)
+
+        # twiddles of stage with butterflies of half-size m are powers of a primitive 2m-th root of unity
+        self._twiddles = []
+        self._inv_twiddles = []
+        m = 1
+        while m < N:
+            self._twiddles.append(_powers(pow(omega, N // (2 * m), q), m, q))
+            self._inv_twiddles.append(_powers(pow(omega_inv, N // (2 * m), q), m, q))
+            m *= 2
+
+        N_inv = integer_ring.modinv(N, q)
+        if negacyclic:
+            self._pre = _powers(root, N, q)
+            self._post = (_powers(integer_ring.modinv(root, q), N, q) * N_inv) % q
+        else:
+            self._pre = None
+            self._post = np.full(N, N_inv, dtype=int)
+
+
+    @staticmethod
+    def is_supported(N: int, q: int, negacyclic: bool = True) -> bool:
+        r'''Checks whether transform exists and fits into int64 arithmetic for given parameters,
+        i.e. $N \ge 2$ is power of two, $q < 2^{31}$ is prime and $q \equiv 1 \pmod {2N}$ (or $\pmod N$ in cyclic case).
+
+        Args:
+            N: Length of the transform.
+            q: Integer modulus.
+            negacyclic: Whether transform is for $X^N + 1$ (`True`) or $X^N - 1$ (`False`) modulus.
+
+        Returns:
+            `True` if NTT can be constructed for given parameters, `False` otherwise.
+        '''
+        if N < 2 or N & (N - 1) != 0 or not (2 < q < 2 ** 31):
+            return False
+        if (q - 1) % (2 * N if negacyclic else N) != 0:
+            return False
+        return prime.is_prime(q)
+
+
+    def _butterflies(self, A: np.ndarray, twiddles: list) -> np.ndarray:
+        q, N = self.q, self.N
+        lead = A.shape[:-1]
+        A = A[..., self._rev]
+        # lazy reduction: only the twiddle products are reduced, sums and differences (shifted by q to stay nonnegative)
+        # grow by at most q per stage and get reduced only when the next product could overflow int64
+        bound = q
+        m = 1
+        for w in twiddles:
+            if bound * q >= 2 ** 63:
+                A %= q
+                bound = q
+            A = A.reshape(lead + (N // (2 * m), 2, m))
+            u = A[..., 0, :]
+            v = A[..., 1, :] * w
+            v %= q
+            B = np.empty_like(A)
+            np.add(u, v, out=B[..., 0, :])
+            np.subtract(u, v, out=B[..., 1, :])
+            B[..., 1, :] += q
+            A = B
+            bound += q
+            m *= 2
+        return A.reshape(lead + (N,)) % q
+
+
+    def forward(self, polynomials: np.ndarray) -> np.ndarray:
+        r'''Computes transform of polynomials given in the dense representation.
+
+        Args:
+            polynomials: Array of shape `(..., N)` with coefficients of polynomials in the last axis.
+
+        Returns:
+            Array of shape `(..., N)` with transforms.
+        '''
+        A = np.asarray(polynomials, dtype=int) % self.q
+        if self._pre is not None:
+            A = (A * self._pre) % self.q
+        return self._butterflies(A, self._twiddles)
+
+
+    def inverse(self, transforms: np.ndarray) -> np.ndarray:
+        r'''Computes inverse transform.
+
+        Args:
+            transforms: Array of shape `(..., N)` with transforms in the last axis.
+
+        Returns:
+            Array of shape `(..., N)` with coefficients of polynomials in the dense representation.
+        '''
+        A = self._butterflies(np.asarray(transforms, dtype=int) % self.q, self._inv_twiddles)
+        return (A * self._post) % self.q
+
+
+    def pointwise_mul(self, transforms_a: np.ndarray, transforms_b: np.ndarray) -> np.ndarray:
+        r'''Multiplies transforms pointwise, i.e. multiplies polynomials in the evaluation domain. Leading axes are broadcast.
+
+        Args:
+            transforms_a: Array of shape `(..., N)` with transforms.
+            transforms_b: Array of shape `(..., N)` with transforms.
+
+        Returns:
+            Array of shape `(..., N)` with transforms of products.
+        '''
+        return (transforms_a * transforms_b) % self.q
+
+
+    def pointwise_inv(self, transforms: np.ndarray) -> np.ndarray:
+        r'''Inverts transforms pointwise, i.e. inverts polynomials in the evaluation domain.
+        Polynomial is a unit in the ring iff all values of it's transform are nonzero.
+
+        Args:
+            transforms: Array of shape `(..., N)` with transforms.
+
+        Returns:
+            Array of shape `(..., N)` with transforms of inverses, zero values are left zero.
+        '''
+        y, z, r = np.ones_like(transforms), transforms % self.q, self.q - 2
+        while r != 0:
+            if r % 2 == 1:
+                y = (y * z) % self.q
+            r //= 2
+            z = (z * z) % self.q
+        return y
+
+
+    def mul(self, polynomials_a: np.ndarray, polynomials_b: np.ndarray) -> np.ndarray:
+        r'''Multiplies polynomials given in the dense representation in the ring. Leading axes are broadcast.
+
+        Args:
+            polynomials_a: Array of shape `(..., N)` with coefficients of polynomials $a$.
+            polynomials_b: Array of shape `(..., N)` with coefficients of polynomials $b$.
+
+        Returns:
+            Array of shape `(..., N)` with coefficients of polynomials $a \cdot b$.
+        '''
+        return self.inverse(self.pointwise_mul(self.forward(polynomials_a), self.forward(polynomials_b)))
+
+
+def _powers(x: int, n: int, q: int) -> VectorModInt:
+    r'''Returns array $[1, x, x^2, \ldots, x^{n-1}] \bmod q$.'''
+    r = np.empty(n, dtype=int)
+    y = 1
+    for i in range(n):
+        r[i] = y
+        y = (y * x) % q
+    return r
+
+
+def _generator(q: int) -> int:
+    r'''Finds the smallest generator of the multiplicative group of $\mathbb{Z}_q$ for prime $q$.'''
+    factors = []
+    m, d = q - 1, 2
+    while d * d <= m:
+        if m % d == 0:
+            factors.append(d)
+            while m % d == 0:
+                m //= d
+        d += 1
+    if m > 1:
+        factors.append(m)
+
+    g = 2
+    while any(pow(g, (q - 1) // f, q) == 1 for f in factors):
+        g += 1
+    return g
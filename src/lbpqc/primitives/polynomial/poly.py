@@ -9,6 +9,45 @@ Z[X] ring
 '''
 
 
+r'''
+Size thresholds used by `mul` to choose the multiplication algorithm.
+When the product fits into int64, operands with at most `INT64_FFT_THRESHOLD` coefficients are multiplied with numpy's (schoolbook) convolution,
+longer ones with FFT.
+Otherwise operands with at most `KARATSUBA_THRESHOLD` coefficients use schoolbook multiplication over python ints,
+operands with at most `FFT_THRESHOLD` coefficients use Karatsuba and longer ones use FFT.
+`batch_mul` uses vectorized schoolbook multiplication for operands with at most `BATCH_SCHOOLBOOK_THRESHOLD` coefficients.
+'''
+KARATSUBA_THRESHOLD = 32
+FFT_THRESHOLD = 128
+INT64_FFT_THRESHOLD = 256
+BATCH_SCHOOLBOOK_THRESHOLD = 32
+
+r'''
+Recursion cutoff of `karatsuba_mod_mul`: operands are split in halves until their length is at most `MOD_KARATSUBA_CUTOFF`.
+'''
+MOD_KARATSUBA_CUTOFF = 16
+
+r'''
+Maximal weight of a ternary polynomial, for which `PolyQuotientRing.mul` uses `sparse_ternary_mul` instead of the dense multiplication.
+'''
+SPARSE_TERNARY_THRESHOLD = 96
+
+# max bit length of a coefficient of a limb product computed with the float64 FFT, that is still rounded exactly
+_FFT_EXACT_BITS = 48
+
+
+
+
+def _trim(p: VectorInt, copy: bool = True) -> VectorInt:
+    r'''Unchecked variant of `trim` used internally on arrays that are known to be non-empty.
+    With `copy` set to `False` the result may be a view of `p`.
+    '''
+    nonzeros = np.flatnonzero(p)
+    if len(nonzeros) == 0:
+        return np.zeros(1, dtype=int)
+
+    r = p[:nonzeros[-1] + 1]
+    return r.copy() if copy else r
 
 
 @enforce_type_check
@@ -71,10 +110,9 @@ def trim(p: VectorInt) -> VectorInt:
         >>> trim(p)
         array([1,0,2,3])
     '''
-    if is_zero_poly(p):
-        return np.zeros(1, dtype=int)
-    
-    return p[:deg(p) + 1].copy()
+    if len(p) == 0: raise ValueError("Empty numpy array is not a proper polynomial")
+
+    return _trim(p)
 
 
 @enforce_type_check
@@ -157,8 +195,13 @@ def add(p: VectorInt, q: VectorInt) -> VectorInt:
         Coefficients array of polynomial $p + q$.
     '''
 
-    max_deg = max(deg(p), deg(q), 0)
-    return trim(pad(p, max_deg) + pad(q, max_deg))
+    if len(p) == 0 or len(q) == 0: raise ValueError("Empty numpy array is not a proper polynomial")
+
+    if len(p) < len(q):
+        p, q = q, p
+    r = p.copy()
+    r[:len(q)] += q
+    return _trim(r, copy=False)
 
 
 @enforce_type_check
@@ -173,20 +216,490 @@ def sub(p: VectorInt, q: VectorInt) -> VectorInt:
         Coefficients array of polynomial $p - q$.
     '''
 
-    max_deg = max(deg(p), deg(q), 0)
-    return trim(pad(p, max_deg) - pad(q, max_deg))
+    if len(p) == 0 or len(q) == 0: raise ValueError("Empty numpy array is not a proper polynomial")
+
+    r = to_dense(p, max(len(p), len(q)))
+    r[:len(q)] -= q
+    return _trim(r, copy=False)
+
+
+def to_dense(p: VectorInt, length: int, out: VectorInt | None = None) -> VectorInt:
+    r'''Converts polynomial to the fixed-length dense representation,
+    i.e. coefficients' array of exactly `length` entries, that is never trimmed.
+    Dense kernels (`dense_add`, `dense_sub`, `dense_neg`, `dense_scale`) operate on this representation.
+
+    Args:
+        p: Polynomial's coefficients.
+        length: Length of the resulting array.
+        out: Optional array of shape `(length,)`, that the result is written to.
+
+    Returns:
+        Coefficients' array of length `length`.
+
+    Raises:
+        ValueError: If $\deg(p) \geq$ `length`.
+    '''
+    k = min(len(p), length)
+    if len(p) > length and np.any(p[length:]):
+        raise ValueError(f"polynomial of degree {deg(p)} does not fit into dense representation of length {length}")
+
+    if out is None:
+        out = np.zeros(length, dtype=int)
+    else:
+        out[k:] = 0
+    out[:k] = p[:k]
+    return out
+
+
+def dense_add(p: VectorInt, q: VectorInt, modulus: int | None = None, out: VectorInt | None = None) -> VectorInt:
+    r'''Adds two polynomials in the fixed-length dense representation.
+    Arrays are not type checked and the result is not trimmed,
+    so this is a single numpy operation (two if `modulus` is given).
+
+    Args:
+        p: polynomial's $p$ coefficients.
+        q: polynomial's $q$ coefficients, same length as $p$.
+        modulus: If given, coefficients of the result are reduced modulo `modulus`.
+        out: Optional array the result is written to, may be the same as `p` or `q`.
+
+    Returns:
+        Coefficients array of polynomial $p + q$ of the same length as the inputs.
+    '''
+    out = np.add(p, q, out=out)
+    if modulus is not None:
+        np.remainder(out, modulus, out=out)
+    return out
+
+
+def dense_sub(p: VectorInt, q: VectorInt, modulus: int | None = None, out: VectorInt | None = None) -> VectorInt:
+    r'''Subtracts polynomial $q$ from polynomial $p$ in the fixed-length dense representation.
+    See `dense_add`.
+
+    Args:
+        p: polynomial's $p$ coefficients.
+        q: polynomial's $q$ coefficients, same length as $p$.
+        modulus: If given, coefficients of the result are reduced modulo `modulus`.
+        out: Optional array the result is written to, may be the same as `p` or `q`.
+
+    Returns:
+        Coefficients array of polynomial $p - q$ of the same length as the inputs.
+    '''
+    out = np.subtract(p, q, out=out)
+    if modulus is not None:
+        np.remainder(out, modulus, out=out)
+    return out
+
+
+def dense_neg(p: VectorInt, modulus: int | None = None, out: VectorInt | None = None) -> VectorInt:
+    r'''Negates polynomial in the fixed-length dense representation.
+    See `dense_add`.
+
+    Args:
+        p: polynomial's $p$ coefficients.
+        modulus: If given, coefficients of the result are reduced modulo `modulus`.
+        out: Optional array the result is written to, may be the same as `p`.
+
+    Returns:
+        Coefficients array of polynomial $-p$ of the same length as the input.
+    '''
+    out = np.negative(p, out=out)
+    if modulus is not None:
+        np.remainder(out, modulus, out=out)
+    return out
+
+
+def dense_scale(p: VectorInt, c: int, modulus: int | None = None, out: VectorInt | None = None) -> VectorInt:
+    r'''Multiplies polynomial in the fixed-length dense representation by scalar $c$.
+    See `dense_add`.
+
+    Args:
+        p: polynomial's $p$ coefficients.
+        c: Scalar.
+        modulus: If given, coefficients of the result are reduced modulo `modulus`.
+        out: Optional array the result is written to, may be the same as `p`.
+
+    Returns:
+        Coefficients array of polynomial $c \cdot p$ of the same length as the input.
+    '''
+    out = np.multiply(p, c, out=out)
+    if modulus is not None:
+        np.remainder(out, modulus, out=out)
+    return out
+
+
+def _bit_length(p: Vector) -> int:
+    r'''Bit length of the largest absolute value of the coefficients of integer (or object of python ints) array.'''
+    if p.size == 0:
+        return 0
+    return int(np.max(np.abs(p))).bit_length()
+
+
+def _narrow(p: Vector) -> Vector:
+    r'''Converts array of python ints to int64 array, if all entries fit.'''
+    if p.dtype == object and _bit_length(p) < 63:
+        return p.astype(int)
+    return p
+
+
+def _centered(p: Vector | Matrix, modulus: int) -> Vector | Matrix:
+    r'''Centered representatives of coefficients modulo `modulus`, from $[-\lfloor \frac{m}{2} \rfloor, \lceil \frac{m}{2} \rceil)$.
+    Coefficients are reduced first and computed with python ints for moduli close to $2^{63}$, so that int64 arithmetic doesn't overflow.
+    '''
+    if p.dtype != object and modulus >= 2 ** 62:
+        p = p.astype(object)
+    p = p % modulus
+    return _narrow((p + modulus // 2) % modulus - modulus // 2)
+
+
+def _karatsuba_mul(p: Vector, q: Vector, cutoff: int) -> Vector:
+    r'''Karatsuba multiplication, that falls back to schoolbook below `cutoff` coefficients.
+    For int64 arrays intermediate overflows wrap around modulo $2^{64}$, so the result is exact whenever its coefficients fit into int64.
+    '''
+    n, m = len(p), len(q)
+    if min(n, m) <= cutoff:
+        return np.convolve(p, q)
+
+    if n < m:
+        p, q, n, m = q, p, m, n
+    h = (n + 1) // 2
+    if m <= h:
+        # unbalanced operands, only the longer one is split
+        r = np.zeros(n + m - 1, dtype=p.dtype)
+        r[:h + m - 1] += _karatsuba_mul(p[:h], q, cutoff)
+        r[h:] += _karatsuba_mul(p[h:], q, cutoff)
+        return r
+
+    p0, p1 = p[:h], p[h:]
+    q0, q1 = q[:h], q[h:]
+    z0 = _karatsuba_mul(p0, q0, cutoff)
+    z2 = _karatsuba_mul(p1, q1, cutoff)
+    ps = p0.copy()
+    ps[:len(p1)] += p1
+    qs = q0.copy()
+    qs[:len(q1)] += q1
+    z1 = _karatsuba_mul(ps, qs, cutoff)
+    z1[:len(z0)] -= z0
+    z1[:len(z2)] -= z2
+
+    r = np.zeros(n + m - 1, dtype=p.dtype)
+    r[:len(z0)] += z0
+    r[2 * h:] += z2
+    r[h:h + len(z1)] += z1[:n + m - 1 - h]
+    return r
+
+
+def _limbs(p: Vector, limb_bits: int, n_limbs: int) -> VectorFloat:
+    r'''Splits integer coefficients into `n_limbs` balanced limbs from $[-2^{b-1}, 2^{b-1})$, where $b$ is `limb_bits`,
+    so that $p = \sum_i 2^{bi} l_i$. Returns float array of shape `(n_limbs,) + p.shape`.
+    Limbs represent coefficients exactly only if $|p_j| < 2^{kb - 2}$ for $k$ = `n_limbs` (balanced digits cover only about a third of the range above zero for $b = 2$).
+    '''
+    half, mask = 1 << (limb_bits - 1), (1 << limb_bits) - 1
+    limbs = np.empty((n_limbs,) + p.shape, dtype=float)
+    x = p
+    for i in range(n_limbs):
+        d = ((x + half) & mask) - half
+        limbs[i] = d
+        x = (x - d) >> limb_bits
+    return limbs
+
+
+def _fft_mul(p: Vector, q: Vector) -> Vector:
+    r'''Exact multiplication of integer polynomials through float64 FFT.
+    Coefficients are split into limbs small enough for the convolution of limbs to be rounded exactly,
+    limb products are accumulated in the frequency domain and recombined with exact integer arithmetic.
+    Works along the last axis, leading axes are broadcast, so stacked polynomials are multiplied with a single transform.
+    '''
+    n, m = p.shape[-1], q.shape[-1]
+    length = n + m - 1
+    size = 1 << (length - 1).bit_length()
+    bits_p, bits_q = _bit_length(p), _bit_length(q)
+    log_len = min(n, m).bit_length()
+
+    # largest limb width, for which limbs convolution (summed over all limb pairs) stays below _FFT_EXACT_BITS,
+    # k balanced limbs of b bits represent all values of absolute value below 2^(kb - 2), hence bits + 2 (see `_limbs`)
+    limb_bits = max(bits_p, bits_q) + 2
+    while True:
+        k_p = max(1, -(-(bits_p + 2) // limb_bits))
+        k_q = max(1, -(-(bits_q + 2) // limb_bits))
+        if 2 * (limb_bits - 1) + log_len + min(k_p, k_q).bit_length() <= _FFT_EXACT_BITS or limb_bits == 2:
+            break
+        limb_bits -= 1
+
+    # int64 limb extraction would overflow for coefficients close to 2^63
+    if p.dtype != object and bits_p >= 62:
+        p = p.astype(object)
+    if q.dtype != object and bits_q >= 62:
+        q = q.astype(object)
+
+    P = np.fft.rfft(_limbs(p, limb_bits, k_p), size)
+    Q = np.fft.rfft(_limbs(q, limb_bits, k_q), size)
+    big = bits_p + bits_q + log_len >= 62
+    r = np.zeros(np.broadcast_shapes(p.shape[:-1], q.shape[:-1]) + (length,), dtype=object if big else int)
+    for s in range(k_p + k_q - 1):
+        i = np.arange(max(0, s - k_q + 1), min(s, k_p - 1) + 1)
+        C = np.rint(np.fft.irfft(np.sum(P[i] * Q[s - i], axis=0), size)[..., :length]).astype(int)
+        if big:
+            r += C.astype(object) * (1 << (limb_bits * s))
+        else:
+            r += C << (limb_bits * s)
+    return _narrow(r)
 
 
 @enforce_type_check
-def mul(p: Vector, q: Vector) -> Vector:
+def mul(p: Vector, q: Vector, modulus: int | None = None) -> Vector:
     r'''Multiplies polynomials $p$ and $q$.
-    
+
+    For integer polynomials the result is exact for arbitrary degrees and coefficients.
+    Depending on the size of the operands schoolbook, Karatsuba or FFT multiplication is used (see `KARATSUBA_THRESHOLD` and `FFT_THRESHOLD`).
+    FFT multiplication splits coefficients into limbs, so that the floating point convolution can be rounded exactly.
+    Coefficients that don't fit into int64 are returned as an array of python ints (`dtype=object`).
+
     Args:
         p: polynomial's $p$ coefficients.
         q: polynomial's $q$ coefficients.
-    
+        modulus: If given, the product is computed in $\mathbb{Z}_{m}[X]$, i.e. coefficients of the result are reduced modulo `modulus`.
+
     Returns:
         Coefficients array of polynomial $p \cdot q$.
     '''
+    if not (_is_integral(p) and _is_integral(q)):
+        return np.polymul(p[::-1], q[::-1])[::-1]
+
+    if modulus is not None:
+        # centered representatives keep the bit length of the product minimal
+        p, q = _centered(p, modulus), _centered(q, modulus)
+
+    p, q = _trim(p, copy=False), _trim(q, copy=False)
+    n = min(len(p), len(q))
+    bits = _bit_length(p) + _bit_length(q) + n.bit_length()
+
+    if bits < 63 and p.dtype != object and q.dtype != object:
+        # int64 arithmetic wraps around modulo 2^64, so the convolution is exact when the result fits
+        r = np.convolve(p, q) if n <= INT64_FFT_THRESHOLD else _fft_mul(p, q)
+    elif n <= KARATSUBA_THRESHOLD:
+        r = _narrow(np.convolve(p.astype(object), q.astype(object)))
+    elif n <= FFT_THRESHOLD:
+        r = _narrow(_karatsuba_mul(p.astype(object), q.astype(object), KARATSUBA_THRESHOLD))
+    else:
+        r = _fft_mul(p, q)
+
+    if modulus is not None:
+        r = _trim(_narrow(r % modulus), copy=False)
+    return r
+
+
+def karatsuba_supported(modulus: int, cutoff: int | None = None) -> bool:
+    r'''Checks whether `karatsuba_mod_mul` computes exact products for given modulus,
+    i.e. modulus is a power of two (int64 arithmetic wraps around modulo $2^{64}$, which is a multiple of the modulus)
+    or products of reduced coefficients summed over a leaf of the recursion fit into int64.
+
+    Args:
+        modulus: Integer modulus.
+        cutoff: Recursion cutoff, defaults to `MOD_KARATSUBA_CUTOFF`.
+
+    Returns:
+        `True` if `karatsuba_mod_mul` can be used with the modulus, `False` otherwise.
+    '''
+    cutoff = MOD_KARATSUBA_CUTOFF if cutoff is None else cutoff
+    if modulus & (modulus - 1) == 0:
+        return modulus <= 2 ** 63
+    return 2 * modulus.bit_length() + cutoff.bit_length() + 2 < 64
+
+
+def karatsuba_mod_mul(P: Vector | Matrix, Q: Vector | Matrix, modulus: int, cutoff: int | None = None) -> Vector | Matrix:
+    r'''Multiplies polynomials in $\mathbb{Z}_{m}[X]$ with Karatsuba method vectorized over whole levels of the recursion.
+
+    Operands are zero padded to the length $c \cdot 2^L$ with $c \le$ `cutoff` and split $L$ times into halves,
+    each level triples the number of rows (low halves, high halves and their sums), so the recursion is a sequence of $O(L)$ array operations.
+    Leaves are multiplied with schoolbook method vectorized over all $3^L$ rows and the products are recombined level by level.
+    Arithmetic is done in int64 with reductions modulo $m$ after each level, or with no intermediate reductions at all for power of two $m$
+    (see `karatsuba_supported`), so the result is exact.
+
+    Works along the last axis, leading axes are broadcast, so batches of polynomials in rows are multiplied at once.
+
+    Args:
+        P: Coefficients of polynomials $p$ along the last axis.
+        Q: Coefficients of polynomials $q$ along the last axis.
+        modulus: Integer modulus $m$, such that `karatsuba_supported(modulus, cutoff)`.
+        cutoff: Recursion cutoff, defaults to `MOD_KARATSUBA_CUTOFF`.
+
+    Returns:
+        Array with coefficients of polynomials $p \cdot q$ reduced modulo $m$ (not trimmed) along the last axis.
+
+    Raises:
+        ValueError: If modulus is not supported.
+    '''
+    cutoff = MOD_KARATSUBA_CUTOFF if cutoff is None else cutoff
+    if not karatsuba_supported(modulus, cutoff):
+        raise ValueError(f"modulus {modulus} is not supported by Karatsuba multiplication with int64 arithmetic")
+
+    # int64 arithmetic is exact modulo powers of two, other moduli require reductions after every level
+    wrap = modulus & (modulus - 1) == 0
+    n_p, n_q = P.shape[-1], Q.shape[-1]
+    lead = np.broadcast_shapes(P.shape[:-1], Q.shape[:-1])
+    n = max(n_p, n_q)
+    levels = max(0, (-(-n // cutoff) - 1).bit_length())
+    size = -(-n // (1 << levels)) << levels
+
+    rows = int(np.prod(lead, dtype=int))
+    A = np.zeros((rows, size), dtype=int)
+    B = np.zeros((rows, size), dtype=int)
+    A[:, :n_p] = np.broadcast_to(P % modulus, lead + (n_p,)).reshape(rows, n_p)
+    B[:, :n_q] = np.broadcast_to(Q % modulus, lead + (n_q,)).reshape(rows, n_q)
+
+    for _ in range(levels):
+        h = A.shape[1] // 2
+        A = np.concatenate((A[:, :h], A[:, h:], A[:, :h] + A[:, h:]))
+        B = np.concatenate((B[:, :h], B[:, h:], B[:, :h] + B[:, h:]))
+        if not wrap:
+            A[2 * len(A) // 3:] %= modulus
+            B[2 * len(B) // 3:] %= modulus
+
+    c = A.shape[1]
+    R = np.zeros((A.shape[0], 2 * c - 1), dtype=int)
+    for i in range(c):
+        R[:, i:i + c] += A[:, i, np.newaxis] * B
+    if not wrap:
+        R %= modulus
+
+    for _ in range(levels):
+        k, h = len(R) // 3, (R.shape[1] + 1) // 2
+        R_low, R_high, R_mid = R[:k], R[k:2 * k], R[2 * k:]
+        S = np.zeros((k, 4 * h - 1), dtype=int)
+        S[:, :2 * h - 1] += R_low
+        S[:, 2 * h:] += R_high
+        S[:, h:3 * h - 1] += R_mid - R_low - R_high
+        if not wrap:
+            S %= modulus
+        R = S
+
+    length = n_p + n_q - 1
+    return (R[:, :length] % modulus).reshape(lead + (length,))
+
+
+@enforce_type_check
+def sparse_ternary(p: VectorInt, modulus: int | None = None, max_weight: int | None = None) -> Tuple[VectorInt, VectorInt] | None:
+    r'''Converts ternary polynomial (with coefficients from $\{-1, 0, 1\}$) to the sparse representation,
+    i.e. pair of arrays with indices of coefficients equal to $1$ and $-1$.
+
+    Args:
+        p: Polynomial's coefficients array.
+        modulus: If given, coefficients are considered modulo `modulus` (so e.g. $m - 1$ is $-1$).
+        max_weight: If given, polynomials with more than `max_weight` nonzero coefficients are rejected.
+
+    Returns:
+        Tuple (plus, minus) of indices arrays or None if polynomial is not ternary (or is too heavy).
+    '''
+    if max_weight is not None and np.count_nonzero(p % modulus if modulus is not None else p) > max_weight:
+        return None
+
+    if modulus is not None:
+        p = (p + 1) % modulus - 1
+    plus, minus = np.flatnonzero(p == 1), np.flatnonzero(p == -1)
+    if len(plus) + len(minus) != np.count_nonzero(p):
+        return None
+    return plus, minus
+
+
+def sparse_ternary_mul(plus: VectorInt, minus: VectorInt, q: VectorInt) -> VectorInt:
+    r'''Multiplies ternary polynomial given in the sparse representation (see `sparse_ternary`) by dense polynomial $q$.
+    Product is computed as sum of shifted copies of $q$, with one vectorized add per nonzero coefficient,
+    so it takes $O(d \cdot n)$ operations for ternary polynomial of weight $d$ and $q$ of length $n$.
+
+    Args:
+        plus: Indices of coefficients equal to $1$.
+        minus: Indices of coefficients equal to $-1$.
+        q: Polynomial's coefficients array.
+
+    Returns:
+        Coefficients array of the product.
+    '''
+    n = len(q)
+    top = max([-1] + [int(np.max(idx)) for idx in (plus, minus) if len(idx) != 0])
+    R = np.zeros(top + n, dtype=q.dtype) if top >= 0 else np.zeros(1, dtype=int)
+    for i in plus.tolist():
+        R[i:i + n] += q
+    for i in minus.tolist():
+        R[i:i + n] -= q
+    return _trim(R, copy=False)
+
+
+def _is_integral(p: Vector) -> bool:
+    return p.dtype == object or np.issubdtype(p.dtype, np.integer)
+
+
+r'''
+Batched arithmetic.
+Batch of polynomials is represented as a matrix of shape `(batch, N)`, with rows being coefficients' arrays in the fixed-length dense representation.
+Results are never trimmed, so that all rows keep the same length.
+A batch with a single row is broadcast against the other operand.
+'''
+
+
+@enforce_type_check
+def batch_add(P: MatrixInt, Q: MatrixInt) -> MatrixInt:
+    r'''Adds two batches of polynomials row by row.
+
+    Args:
+        P: Matrix of shape `(batch, n)` with polynomials' coefficients in rows.
+        Q: Matrix of shape `(batch, m)` with polynomials' coefficients in rows.
+
+    Returns:
+        Matrix of shape `(batch, max(n, m))` with coefficients of polynomials $p_i + q_i$ in rows.
+    '''
+    R = np.zeros(np.broadcast_shapes(P.shape[:1], Q.shape[:1]) + (max(P.shape[1], Q.shape[1]),), dtype=int)
+    R[:, :P.shape[1]] += P
+    R[:, :Q.shape[1]] += Q
+    return R
+
+
+@enforce_type_check
+def batch_sub(P: MatrixInt, Q: MatrixInt) -> MatrixInt:
+    r'''Subtracts batch of polynomials $Q$ from batch $P$ row by row.
+
+    Args:
+        P: Matrix of shape `(batch, n)` with polynomials' coefficients in rows.
+        Q: Matrix of shape `(batch, m)` with polynomials' coefficients in rows.
+
+    Returns:
+        Matrix of shape `(batch, max(n, m))` with coefficients of polynomials $p_i - q_i$ in rows.
+    '''
+    R = np.zeros(np.broadcast_shapes(P.shape[:1], Q.shape[:1]) + (max(P.shape[1], Q.shape[1]),), dtype=int)
+    R[:, :P.shape[1]] += P
+    R[:, :Q.shape[1]] -= Q
+    return R
+
+
+@enforce_type_check
+def batch_mul(P: Matrix, Q: Matrix, modulus: int | None = None) -> Matrix:
+    r'''Multiplies two batches of integer polynomials row by row.
+
+    Short operands are multiplied with schoolbook method vectorized over the batch,
+    longer ones with a single batched FFT with limbs splitting (see `mul`), so the result is exact.
+
+    Args:
+        P: Matrix of shape `(batch, n)` with polynomials' coefficients in rows.
+        Q: Matrix of shape `(batch, m)` with polynomials' coefficients in rows.
+        modulus: If given, products are computed in $\mathbb{Z}_{m}[X]$.
+
+    Returns:
+        Matrix of shape `(batch, n + m - 1)` with coefficients of polynomials $p_i \cdot q_i$ in rows.
+    '''
+    if modulus is not None:
+        P, Q = _centered(P, modulus), _centered(Q, modulus)
+
+    n, m = P.shape[1], Q.shape[1]
+    if n > m:
+        P, Q, n, m = Q, P, m, n
+
+    bits = _bit_length(P) + _bit_length(Q) + n.bit_length()
+    if n <= BATCH_SCHOOLBOOK_THRESHOLD and bits < 63 and P.dtype != object and Q.dtype != object:
+        R = np.zeros(np.broadcast_shapes(P.shape[:1], Q.shape[:1]) + (n + m - 1,), dtype=int)
+        for i in range(n):
+            R[:, i:i + m] += P[:, i, np.newaxis] * Q
+    else:
+        R = _fft_mul(P, Q)
 
-    return np.polymul(p[::-1], q[::-1])[::-1]
\ No newline at end of file
+    if modulus is not None:
+        R = _narrow(R % modulus)
+    return R
@@ -1,7 +1,7 @@
 from lbpqc.type_aliases import *
 
-from lbpqc.primitives.integer import integer_ring
-from lbpqc.primitives.polynomial import poly, modpoly
+from lbpqc.primitives.integer import integer_ring, prime
+from lbpqc.primitives.polynomial import poly, modpoly, ntt
 
 
 class PolyQuotientRing:
@@ -18,20 +18,44 @@ class PolyQuotientRing:
     Attributes:
         poly_modulus (VectorInt): .
         int_modulus (int): .
+        N (int): Degree of the polynomial modulus, i.e. length of the dense representation of ring's elements.
+        family (str | None): Family of the polynomial modulus, one of `"cyclic"` ($X^N - 1$), `"negacyclic"` ($X^N + 1$), `"trinomial"` ($X^N - X - 1$)
+            or `None` for arbitrary modulus. For tagged families reduction is a vectorized folding of the high coefficients instead of polynomial division.
+        ntt (NTT | None): Number theoretic transform engine with cached twiddles, for cyclic and negacyclic rings with NTT-friendly parameters (see `NTT.is_supported`).
+            When present it's used by `inv` and `batch_inv`, and by `mul` and `batch_mul` for moduli too large for the single-limb float FFT product,
+            which is faster in numpy for small moduli. Rings with such moduli, but without NTT, multiply with `poly.karatsuba_mod_mul` if possible.
         Zm (ModIntPolyRing): Object representing $\mathbb{Z}_p$ ring.
     '''
     @enforce_type_check
-    def __init__(self, poly_modulus: VectorInt, int_modulus: int) -> None:
+    def __init__(self, poly_modulus: VectorInt, int_modulus: int, family: str | None = None) -> None:
         r'''Constructs the ring object for a given polynomial modulus and integer modulus.
 
         Args:
             poly_modulus: Coefficients array of polynomial modulus fot the ring. The $q(X)$ in $\frac{\mathbb{Z}_p[X]}{q(X)}$.
             int_modulus: Integer modulus for the ring. The $p$ in $\frac{\mathbb{Z}_p[X]}{q(X)}$.
+            family: Family of the polynomial modulus (see `family` attribute). If `None`, it's detected from `poly_modulus`.
+
+        Raises:
+            ValueError: If `family` does not match `poly_modulus`.
         '''
         self.poly_modulus = poly_modulus
         self.int_modulus = int_modulus
+        self.N = int(poly.deg(poly_modulus))
         self.Zm = modpoly.ModIntPolyRing(int_modulus)
 
+        detected = _modulus_family(poly_modulus)
+        if family is not None and family != detected:
+            raise ValueError(f"polynomial modulus is not a member of <{family}> family")
+        self.family = detected
+
+        self.ntt = None
+        if detected in ("cyclic", "negacyclic") and ntt.NTT.is_supported(self.N, int_modulus, detected == "negacyclic"):
+            self.ntt = ntt.NTT(self.N, int_modulus, detected == "negacyclic")
+        # float FFT products of reduced polynomials are single-limb (and fastest) for small moduli
+        fft_limbs = 2 * int_modulus.bit_length() + self.N.bit_length() > poly._FFT_EXACT_BITS
+        self._ntt_mul = self.ntt is not None and fft_limbs
+        self._karatsuba_mul = self.ntt is None and fft_limbs and poly.karatsuba_supported(int_modulus)
+
     
     @property
     def quotient(self):
@@ -50,8 +74,131 @@ class PolyQuotientRing:
         Returns:
             Coefficients array of polynomial that is the remainder of the Euclidean division.
         '''
+        if self.family is not None:
+            return poly._trim(self._fold(polynomial), copy=False)
         return self.Zm.rem(polynomial, self.poly_modulus)
-        
+
+
+    def _fold(self, polynomials: VectorInt | MatrixInt) -> VectorModInt | MatrixModInt:
+        r'''Reduction modulo polynomial modulus of the tagged family by folding coefficients of powers $X^{N + j}$ onto lower ones,
+        vectorized along the last axis (so it works both for single polynomials and batches).
+        Returns array with last axis of length $N$.
+        '''
+        q, N = self.int_modulus, self.N
+        L = polynomials.shape[-1]
+        k = max(1, -(-L // N))
+        # sums of k reduced coefficients have to fit into int64
+        dtype = int if q.bit_length() + k.bit_length() < 63 else object
+        R = np.zeros(polynomials.shape[:-1] + (k * N,), dtype=dtype)
+        R[..., :L] = polynomials % q
+
+        match self.family:
+            case "cyclic":
+                # X^N = 1, so blocks of N coefficients simply wrap around
+                R = R.reshape(R.shape[:-1] + (k, N)).sum(axis=-2)
+            case "negacyclic":
+                # X^N = -1, blocks wrap around with alternating signs
+                signs = np.where(np.arange(k) % 2 == 0, 1, -1).reshape(k, 1)
+                R = (R.reshape(R.shape[:-1] + (k, N)) * signs).sum(axis=-2)
+            case "trinomial":
+                # X^(N + j) = X^(j + 1) + X^j, one shifted add per fold, a single fold suffices for products of reduced polynomials
+                while L > N:
+                    h = L - N
+                    high = R[..., N:L].copy()
+                    R[..., N:L] = 0
+                    R[..., :h] += high
+                    R[..., 1:h + 1] += high
+                    L = max(N, h + 1)
+                    R[..., :L] %= q
+                R = R[..., :N]
+
+        return poly._narrow(R % q)
+
+
+    @enforce_type_check
+    def dense(self, polynomial: VectorInt) -> VectorModInt:
+        r'''Reduces the given polynomial and returns it in the fixed-length dense representation,
+        i.e. as coefficients array of length exactly $N = \deg q$, that is never trimmed.
+
+        Dense representation is used by `dense_add`, `dense_sub`, `dense_neg` and `dense_scale`,
+        which skip type checking, trimming and division by the polynomial modulus.
+
+        Args:
+            polynomial: Polynomial's coefficients array.
+
+        Returns:
+            Coefficients array of length $N$.
+        '''
+        return poly.to_dense(self.reduce(polynomial), self.N)
+
+
+    @enforce_type_check
+    def element(self, polynomial: VectorInt) -> "RingElement":
+        r'''Wraps the given polynomial into `RingElement` bound to the ring, that supports arithmetic operators.
+
+        Args:
+            polynomial: Polynomial's coefficients array.
+
+        Returns:
+            Ring element representing reduced polynomial.
+        '''
+        return RingElement(self, polynomial)
+
+
+    def dense_add(self, polynomial_a: VectorModInt, polynomial_b: VectorModInt, out: VectorModInt | None = None) -> VectorModInt:
+        r'''Adds polynomial $a$ to polynomial $b$, both given in the dense representation (see `dense`).
+
+        Args:
+            polynomial_a: polynomial's $a$ coefficients.
+            polynomial_b: polynomial's $b$ coefficients.
+            out: Optional array the result is written to, may be one of the inputs.
+
+        Returns:
+            Dense coefficients array of polynomial $a + b$.
+        '''
+        return poly.dense_add(polynomial_a, polynomial_b, self.int_modulus, out)
+
+
+    def dense_sub(self, polynomial_a: VectorModInt, polynomial_b: VectorModInt, out: VectorModInt | None = None) -> VectorModInt:
+        r'''Subtract polynomial $b$ from polynomial $a$, both given in the dense representation (see `dense`).
+
+        Args:
+            polynomial_a: polynomial's $a$ coefficients.
+            polynomial_b: polynomial's $b$ coefficients.
+            out: Optional array the result is written to, may be one of the inputs.
+
+        Returns:
+            Dense coefficients array of polynomial $a - b$.
+        '''
+        return poly.dense_sub(polynomial_a, polynomial_b, self.int_modulus, out)
+
+
+    def dense_neg(self, polynomial: VectorModInt, out: VectorModInt | None = None) -> VectorModInt:
+        r'''Negates polynomial given in the dense representation (see `dense`).
+
+        Args:
+            polynomial: Polynomial's coefficients.
+            out: Optional array the result is written to, may be the input.
+
+        Returns:
+            Dense coefficients array of polynomial $-a$.
+        '''
+        return poly.dense_neg(polynomial, self.int_modulus, out)
+
+
+    def dense_scale(self, polynomial: VectorModInt, c: int, out: VectorModInt | None = None) -> VectorModInt:
+        r'''Multiplies polynomial given in the dense representation (see `dense`) by scalar $c$.
+
+        Args:
+            polynomial: Polynomial's coefficients.
+            c: Scalar.
+            out: Optional array the result is written to, may be the input.
+
+        Returns:
+            Dense coefficients array of polynomial $c \cdot a$.
+        '''
+        return poly.dense_scale(polynomial, c, self.int_modulus, out)
+
 
     @enforce_type_check
     def add(self, polynomial_a: VectorInt, polynomial_b: VectorInt) -> VectorModInt:
@@ -65,7 +212,11 @@ class PolyQuotientRing:
             Coefficients array of polynomial $a + b$.
         '''
 
-        return self.reduce(self.Zm.add(polynomial_a, polynomial_b))
+        r = self.Zm.add(polynomial_a, polynomial_b)
+        # sum of polynomials of degree lower than N is already reduced
+        if len(polynomial_a) <= self.N and len(polynomial_b) <= self.N:
+            return r
+        return self.reduce(r)
     
 
     @enforce_type_check
@@ -80,7 +231,10 @@ class PolyQuotientRing:
             Coefficients array of polynomial $a - b$.
         '''
 
-        return self.reduce(self.Zm.sub(polynomial_a, polynomial_b))
+        r = self.Zm.sub(polynomial_a, polynomial_b)
+        if len(polynomial_a) <= self.N and len(polynomial_b) <= self.N:
+            return r
+        return self.reduce(r)
     
     @enforce_type_check
     def mul(self, polynomial_a: VectorInt, polynomial_b: VectorInt) -> VectorModInt:
@@ -93,9 +247,70 @@ class PolyQuotientRing:
         Returns:
             Coefficients array of polynomial $a \cdot b$.
         '''
-        
+        # sparse ternary operands (e.g. secrets and blinding polynomials) are multiplied with shifted adds
+        for s, other in ((polynomial_a, polynomial_b), (polynomial_b, polynomial_a)):
+            if (sparse := poly.sparse_ternary(s, self.int_modulus, poly.SPARSE_TERNARY_THRESHOLD)) is not None:
+                return self.reduce(poly.sparse_ternary_mul(*sparse, other % self.int_modulus))
+
+        if self._ntt_mul:
+            return poly._trim(self.ntt.mul(self._fold(polynomial_a), self._fold(polynomial_b)), copy=False)
+        if self._karatsuba_mul:
+            return self.reduce(poly.karatsuba_mod_mul(polynomial_a, polynomial_b, self.int_modulus))
         return self.reduce(self.Zm.mul(polynomial_a, polynomial_b))
         
+    @enforce_type_check
+    def rotation_matrix(self, polynomial: VectorInt) -> SquareMatrixModInt:
+        r'''Calculates matrix of multiplication by polynomial $a$ in the ring, i.e. $N \times N$ matrix with coefficients of $X^i \cdot a$ in $i$-th row,
+        so that $b \cdot a$ equals to the product of coefficients vector of $b$ (in the dense representation) and the matrix.
+
+        For $X^N - 1$ modulus the matrix is circulant and for $X^N + 1$ it's anti-circulant (entries wrapped around the diagonal are negated),
+        both are gathered at once with a single index array. For other moduli rows are computed iteratively, each one is shifted previous row reduced with single folding step.
+
+        Args:
+            polynomial: polynomial's $a$ coefficients.
+
+        Returns:
+            Matrix of shape `(N, N)` with reduced coefficients of $X^i \cdot a$ in rows.
+        '''
+        q, N = self.int_modulus, self.N
+        a = self.dense(polynomial)
+        if self.family in ("cyclic", "negacyclic"):
+            shifts = np.arange(N)[np.newaxis, :] - np.arange(N)[:, np.newaxis]
+            M = a[shifts % N]
+            if self.family == "negacyclic":
+                M[shifts < 0] *= -1
+            return M % q
+
+        # X^N = -(g_0 + ... + g_{N-1} X^{N-1}) / g_N
+        # int64 products of two reduced coefficients overflow for moduli above 2^31
+        dtype = int if q < 2 ** 31 else object
+        g = (poly.to_dense(self.poly_modulus, N + 1) % q).astype(dtype)
+        g = (g[:N] * integer_ring.modinv(int(g[N]), q)) % q
+        M = np.zeros((N, N), dtype=dtype)
+        M[0] = a
+        for i in range(1, N):
+            M[i, 1:] = M[i - 1, :-1]
+            M[i, 0] = 0
+            M[i] = (M[i] - M[i - 1, -1] * g) % q
+        return poly._narrow(M)
+
+
+    @enforce_type_check
+    def sparse_mul(self, plus: VectorInt, minus: VectorInt, polynomial: VectorInt) -> VectorModInt:
+        r'''Multiplies ternary polynomial given in the sparse representation (see `poly.sparse_ternary`) by polynomial $b$
+        in $O(d \cdot N)$ operations, where $d$ is the weight of the ternary polynomial.
+
+        Args:
+            plus: Indices of coefficients equal to $1$.
+            minus: Indices of coefficients equal to $-1$.
+            polynomial: polynomial's $b$ coefficients.
+
+        Returns:
+            Coefficients array of the product.
+        '''
+        return self.reduce(poly.sparse_ternary_mul(plus, minus, self._fold(polynomial) if self.family is not None else polynomial % self.int_modulus))
+
+
     @enforce_type_check
     def inv(self, polynomial: VectorInt) -> VectorModInt:
         r'''For a given polynomial $v$, calculates it's multiplicative inverse in a ring.
@@ -106,18 +321,411 @@ class PolyQuotientRing:
         Returns:
             Coefficients array of polynomial $u$, such that $u \cdot v \equiv 1$.
 
+        For prime power integer modulus $p^k$ the polynomial is inverted modulo $p$ and the inverse is lifted with Newton-Hensel iteration
+        $u \leftarrow u \cdot (2 - v \cdot u)$, that doubles the $p$-adic precision with two ring multiplications.
+
         Raises:
             ValueError: When given polynomial is not an unit in the ring (it's not coprime with ring's polynomial modulus).
 
         '''
-        
-        if not self.Zm.coprime(polynomial, self.poly_modulus): raise ValueError("Inverse does not exists")
+        if self.ntt is not None:
+            return poly._trim(self._ntt_inv(self._fold(polynomial)), copy=False)
+
+        if (pk := self._prime_power()) is not None:
+            p, k = pk
+            residue_ring = PolyQuotientRing(self.poly_modulus, p)
+            u = residue_ring.dense(residue_ring.inv(polynomial % p))
+            return poly._trim(self._hensel_lift(self.dense(polynomial)[np.newaxis, :], u[np.newaxis, :], k)[0], copy=False)
 
+        # single pass of extended Euclidean algorithm, polynomial is a unit iff the gcd is a unit constant
         gcd, u, _ = self.Zm.eea(polynomial, self.poly_modulus)
+        if len(gcd) != 1 or gcd[0] == 0: raise ValueError("Inverse does not exists")
+
+        c = integer_ring.modinv(int(gcd[0]), self.int_modulus)
+
+        return self.reduce(self.Zm.mul(u, np.array([c])))
+
+
+    def _reduce_rows(self, polynomials: MatrixInt) -> MatrixModInt:
+        r'''Reduces every row of the matrix modulo polynomial modulus and integer modulus,
+        with folding for tagged modulus families or division by the polynomial modulus vectorized over rows
+        (long division or Newton division with the cached reciprocal).
+        Returns matrix of shape `(batch, N)`.
+        '''
+        if self.family is not None:
+            return self._fold(polynomials)
+
+        q, N = self.int_modulus, self.N
+        L = polynomials.shape[1]
+        # int64 products of two reduced coefficients overflow for moduli above 2^31
+        dtype = int if q < 2 ** 31 else object
+        R = np.zeros((polynomials.shape[0], max(L, N)), dtype=dtype)
+        R[:, :L] = polynomials % q
+        if min(N, L - N) >= modpoly.NEWTON_DIVISION_THRESHOLD // 4:
+            # division through reversed power series: quotient is the product of reversed high part with the cached reciprocal
+            g = self.Zm.reduce(self.poly_modulus)
+            h = self.Zm._reversed_reciprocal(g, L - N)
+            Q = poly.batch_mul(R[:, N:][:, ::-1], h[np.newaxis, :], q)[:, :L - N][:, ::-1]
+            G = poly.batch_mul(Q, g[np.newaxis, :], q)
+            R = (R[:, :N] - G[:, :N]) % q
+        elif L > N:
+            g = (poly.to_dense(self.poly_modulus, N + 1) % q).astype(dtype)
+            lc_inv = integer_ring.modinv(int(g[N]), q)
+            g = (g[:N] * lc_inv) % q
+            for k in range(L - 1, N - 1, -1):
+                c = R[:, k]
+                R[:, k - N:k] -= c[:, np.newaxis] * g
+                R[:, k - N:k] %= q
+        return poly._narrow(R[:, :N])
+
+
+    @enforce_type_check
+    def batch_reduce(self, polynomials: MatrixInt) -> MatrixModInt:
+        r'''Reduces a batch of polynomials to their cannonical equivalence classes in the ring.
+        Batch is a matrix of shape `(batch, L)` with polynomials' coefficients in rows.
+        Results are in the dense representation (see `dense`), so that all rows have length $N$.
+
+        Args:
+            polynomials: Matrix with polynomials' coefficients in rows.
+
+        Returns:
+            Matrix of shape `(batch, N)` with reduced polynomials in rows.
+        '''
+        return self._reduce_rows(polynomials)
+
+
+    @enforce_type_check
+    def batch_add(self, polynomials_a: MatrixInt, polynomials_b: MatrixInt) -> MatrixModInt:
+        r'''Adds two batches of polynomials row by row.
+
+        Args:
+            polynomials_a: Matrix with polynomials' $a_i$ coefficients in rows.
+            polynomials_b: Matrix with polynomials' $b_i$ coefficients in rows.
 
-        c = integer_ring.modinv(gcd, self.int_modulus)
+        Returns:
+            Matrix of shape `(batch, N)` with coefficients of polynomials $a_i + b_i$ in rows.
+        '''
+        return self._reduce_rows(poly.batch_add(polynomials_a, polynomials_b))
+
+
+    @enforce_type_check
+    def batch_sub(self, polynomials_a: MatrixInt, polynomials_b: MatrixInt) -> MatrixModInt:
+        r'''Subtracts batch of polynomials $b$ from batch $a$ row by row.
+
+        Args:
+            polynomials_a: Matrix with polynomials' $a_i$ coefficients in rows.
+            polynomials_b: Matrix with polynomials' $b_i$ coefficients in rows.
+
+        Returns:
+            Matrix of shape `(batch, N)` with coefficients of polynomials $a_i - b_i$ in rows.
+        '''
+        return self._reduce_rows(poly.batch_sub(polynomials_a, polynomials_b))
+
+
+    @enforce_type_check
+    def batch_mul(self, polynomials_a: MatrixInt, polynomials_b: MatrixInt) -> MatrixModInt:
+        r'''Multiplies two batches of polynomials row by row.
+        A batch with single row is broadcast, e.g. to multiply many polynomials by the same key.
+
+        Args:
+            polynomials_a: Matrix with polynomials' $a_i$ coefficients in rows.
+            polynomials_b: Matrix with polynomials' $b_i$ coefficients in rows.
+
+        Returns:
+            Matrix of shape `(batch, N)` with coefficients of polynomials $a_i \cdot b_i$ in rows.
+        '''
+        if self._ntt_mul:
+            return self.ntt.mul(self._fold(polynomials_a), self._fold(polynomials_b))
+        if self._karatsuba_mul:
+            return self._reduce_rows(poly.karatsuba_mod_mul(polynomials_a, polynomials_b, self.int_modulus))
+        return self._reduce_rows(self.Zm.batch_mul(polynomials_a, polynomials_b))
+
+
+    @enforce_type_check
+    def batch_inv(self, polynomials: MatrixInt) -> MatrixModInt:
+        r'''Calculates multiplicative inverses of a batch of polynomials.
+
+        Rings with NTT engine invert all rows pointwise in the evaluation domain.
+        For other prime integer moduli the extended Euclidean algorithm runs in lockstep over all rows,
+        one leading term elimination per step, so the whole batch is inverted with $O(N)$ vectorized steps.
+        For prime power moduli the batch is inverted modulo the prime and lifted with Newton-Hensel iteration (see `inv`).
+        For other moduli rows are inverted one by one with `inv`.
+
+        Args:
+            polynomials: Matrix with polynomials' coefficients in rows.
+
+        Returns:
+            Matrix of shape `(batch, N)` with inverses in rows.
+
+        Raises:
+            ValueError: When some of the polynomials is not an unit in the ring.
+        '''
+        A = self._reduce_rows(polynomials)
+        if self.ntt is not None:
+            return self._ntt_inv(A)
+
+        if (pk := self._prime_power()) is not None:
+            p, k = pk
+            return self._hensel_lift(A, PolyQuotientRing(self.poly_modulus, p).batch_inv(A % p), k)
+
+        q = self.int_modulus
+        if not (q < 2 ** 31 and prime.is_prime(q)):
+            return np.array([poly.to_dense(self.inv(a), self.N) for a in A], dtype=int).reshape(A.shape)
+
+        b, N = A.shape
+        L = N + 1
+        r0 = np.tile(poly.to_dense(self.poly_modulus, L) % q, (b, 1))
+        r1 = np.zeros((b, L), dtype=int)
+        r1[:, :N] = A
+        # Bezout cofactors: s_i * a = r_i (mod poly_modulus), their degrees stay below N + 1
+        s0 = np.zeros((b, L), dtype=int)
+        s1 = np.zeros((b, L), dtype=int)
+        s1[:, 0] = 1
+
+        def degs(R):
+            nonzero = R != 0
+            return np.where(nonzero.any(axis=1), R.shape[1] - 1 - np.argmax(nonzero[:, ::-1], axis=1), -1)
+
+        d0, d1 = degs(r0), degs(r1)
+        rows = np.arange(b)
+        U = np.zeros((b, N), dtype=int)
+        idx = np.arange(L)
+        while len(rows) != 0:
+            # rows with zero remainder are finished, r0 is their gcd
+            if np.any(done := d1 < 0):
+                if np.any(d0[done] != 0):
+                    raise ValueError(f"Inverse does not exists for polynomials at indices {rows[done][d0[done] != 0].tolist()}")
+                U[rows[done]] = (s0[done, :N] * _modinv_prime(r0[done, 0], q)[:, np.newaxis]) % q
+                keep = ~done
+                rows, r0, r1, s0, s1, d0, d1 = rows[keep], r0[keep], r1[keep], s0[keep], s1[keep], d0[keep], d1[keep]
+                continue
+
+            swap = np.flatnonzero(d0 < d1)
+            r0[swap], r1[swap] = r1[swap], r0[swap]
+            s0[swap], s1[swap] = s1[swap], s0[swap]
+            d0[swap], d1[swap] = d1[swap], d0[swap]
+
+            # eliminate leading term of r0 with shifted r1
+            i = np.arange(len(rows))
+            c = (r0[i, d0] * _modinv_prime(r1[i, d1], q)) % q
+            # rows that became finished by the swap are left untouched (0^(p-2) is not zero for p = 2)
+            c[d1 < 0] = 0
+            src = idx - (d0 - d1)[:, np.newaxis]
+            valid = src >= 0
+            src[~valid] = 0
+            r0 -= c[:, np.newaxis] * np.where(valid, np.take_along_axis(r1, src, axis=1), 0)
+            r0 %= q
+            s0 -= c[:, np.newaxis] * np.where(valid, np.take_along_axis(s1, src, axis=1), 0)
+            s0 %= q
+            d0 = degs(r0)
+
+        return U
+
+
+    def _prime_power(self) -> tuple[int, int] | None:
+        r'''Returns decomposition $p^k$ of integer modulus if it's a power of prime with $k > 1$.'''
+        pk = prime.prime_power(self.int_modulus)
+        return pk if pk is not None and pk[1] > 1 else None
+
+
+    def _hensel_lift(self, polynomials: MatrixModInt, inverses: MatrixModInt, k: int) -> MatrixModInt:
+        r'''Lifts inverses of rows modulo $p$ to inverses modulo $q = p^k$ with $O(\log k)$ batched ring multiplications.'''
+        q = self.int_modulus
+        U = inverses
+        precision = 1
+        while precision < k:
+            T = (-self.batch_mul(polynomials, U)) % q
+            T[:, 0] = (T[:, 0] + 2) % q
+            U = self.batch_mul(U, T)
+            precision *= 2
+        return U
+
+
+    def _ntt_inv(self, polynomials: VectorModInt | MatrixModInt) -> VectorModInt | MatrixModInt:
+        r'''Inverts polynomials given in the dense representation (along the last axis) pointwise in the evaluation domain.'''
+        T = self.ntt.forward(polynomials)
+        if np.any(singular := (T == 0).any(axis=-1)):
+            if T.ndim == 1:
+                raise ValueError("Inverse does not exists")
+            raise ValueError(f"Inverse does not exists for polynomials at indices {np.flatnonzero(singular).tolist()}")
+        return self.ntt.inverse(self.ntt.pointwise_inv(T))
+
+
+class RingElement:
+    r'''Element of polynomial quotient ring bound to it's `PolyQuotientRing`, supporting `+`, `-`, `*` (also by integer scalars),
+    `**` (with negative exponents for inverses) and `==` operators.
+
+    Element keeps up to two representations: dense coefficients array and, for rings with NTT engine, the transform.
+    Each of them is computed lazily, only when an operation needs it, and cached, so e.g. multiplying many elements by the same public key
+    transforms the key only once and each product costs one pointwise multiplication (plus transform of the other factor).
+    Products and sums of transformed elements stay in the evaluation domain until their coefficients are read.
+
+    Attributes:
+        ring (PolyQuotientRing): Ring the element belongs to.
+    '''
+    __slots__ = ("ring", "_coeffs", "_transform")
+
+    def __init__(self, ring: PolyQuotientRing, polynomial: VectorInt | None = None, transform: VectorModInt | None = None) -> None:
+        r'''Constructs ring element either from polynomial's coefficients or from it's NTT transform.
+
+        Args:
+            ring: Ring the element belongs to.
+            polynomial: Polynomial's coefficients array, it's reduced in the ring.
+            transform: NTT transform of the element (only for rings with NTT engine), used when `polynomial` is `None`.
+
+        Raises:
+            ValueError: If neither `polynomial` nor `transform` is given.
+        '''
+        if polynomial is None and transform is None:
+            raise ValueError("Ring element requires polynomial or it's transform")
+        self.ring = ring
+        self._coeffs = ring.dense(polynomial) if polynomial is not None else None
+        self._transform = transform if polynomial is None else None
+
+
+    @property
+    def coefficients(self) -> VectorModInt:
+        r'''Coefficients array of the reduced polynomial (trimmed, like the results of `PolyQuotientRing` methods).'''
+        return poly._trim(self.dense)
+
+
+    @property
+    def dense(self) -> VectorModInt:
+        r'''Coefficients array of length $N$ (see `PolyQuotientRing.dense`). Computed with inverse NTT on first access if needed.'''
+        if self._coeffs is None:
+            self._coeffs = self.ring.ntt.inverse(self._transform)
+        return self._coeffs
+
+
+    @property
+    def transform(self) -> VectorModInt:
+        r'''NTT transform of the element. Computed on first access and cached.
+
+        Raises:
+            ValueError: If ring has no NTT engine.
+        '''
+        if self._transform is None:
+            if self.ring.ntt is None:
+                raise ValueError("ring does not support NTT")
+            self._transform = self.ring.ntt.forward(self._coeffs)
+        return self._transform
+
+
+    def _in_transform(self) -> bool:
+        return self.ring.ntt is not None and self._transform is not None
+
+
+    def _operand(self, other) -> "RingElement":
+        if isinstance(other, RingElement):
+            if other.ring is not self.ring:
+                raise ValueError("ring elements belong to different rings")
+            return other
+        if isinstance(other, (int, np.integer)):
+            return RingElement(self.ring, np.array([int(other) % self.ring.int_modulus]))
+        return NotImplemented
+
+
+    def _linear(self, other, op) -> "RingElement":
+        other = self._operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        q = self.ring.int_modulus
+        # linear operations commute with the transform, stay in the evaluation domain if both operands are already there
+        if self._in_transform() and other._in_transform() and (self._coeffs is None or other._coeffs is None):
+            return RingElement(self.ring, transform=op(self._transform, other._transform) % q)
+        return RingElement(self.ring, op(self.dense, other.dense) % q)
+
+
+    def __add__(self, other) -> "RingElement":
+        return self._linear(other, np.add)
+
+    __radd__ = __add__
+
+
+    def __sub__(self, other) -> "RingElement":
+        return self._linear(other, np.subtract)
 
-        return self.reduce(u * c)
+
+    def __rsub__(self, other) -> "RingElement":
+        return self._linear(other, lambda a, b: np.subtract(b, a))
+
+
+    def __neg__(self) -> "RingElement":
+        if self._coeffs is None:
+            return RingElement(self.ring, transform=(-self._transform) % self.ring.int_modulus)
+        return RingElement(self.ring, (-self._coeffs) % self.ring.int_modulus)
+
+
+    def __mul__(self, other) -> "RingElement":
+        if isinstance(other, (int, np.integer)):
+            q = self.ring.int_modulus
+            if self._coeffs is None:
+                return RingElement(self.ring, transform=(self._transform * (int(other) % q)) % q)
+            return RingElement(self.ring, poly.dense_scale(self._coeffs, int(other) % q, q))
+        other = self._operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        if self.ring.ntt is not None:
+            return RingElement(self.ring, transform=self.ring.ntt.pointwise_mul(self.transform, other.transform))
+        return RingElement(self.ring, self.ring.mul(self.dense, other.dense))
+
+    __rmul__ = __mul__
+
+
+    def inverse(self) -> "RingElement":
+        r'''Calculates multiplicative inverse of the element (see `PolyQuotientRing.inv`).
+
+        Returns:
+            Ring element $u$, such that $u \cdot v \equiv 1$.
+
+        Raises:
+            ValueError: When element is not an unit in the ring.
+        '''
+        if self.ring.ntt is not None:
+            T = self.transform
+            if np.any(T == 0):
+                raise ValueError("Inverse does not exists")
+            return RingElement(self.ring, transform=self.ring.ntt.pointwise_inv(T))
+        return RingElement(self.ring, self.ring.inv(self.dense))
+
+
+    def __pow__(self, exponent: int) -> "RingElement":
+        if not isinstance(exponent, (int, np.integer)):
+            return NotImplemented
+        base = self.inverse() if exponent < 0 else self
+        exponent = abs(int(exponent))
+
+        result = RingElement(self.ring, np.ones(1, dtype=int))
+        while exponent != 0:
+            if exponent % 2 == 1:
+                result = result * base
+            exponent //= 2
+            if exponent != 0:
+                base = base * base
+        return result
+
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, RingElement):
+            return other.ring is self.ring and np.array_equal(self.dense, other.dense)
+        return NotImplemented
+
+    __hash__ = None
+
+
+    def __repr__(self) -> str:
+        return f"RingElement({self.coefficients})"
+
+
+def _modinv_prime(a: VectorInt, p: int) -> VectorModInt:
+    r'''Elementwise modular inverse modulo prime $p < 2^{31}$ computed as $a^{p-2}$ with vectorized square and multiply.'''
+    y, z, r = np.ones_like(a), a % p, p - 2
+    while r != 0:
+        if r % 2 == 1:
+            y = (y * z) % p
+        r //= 2
+        z = (z * z) % p
+    return y
 
 
 def construct_ring(p: str, N: int, q: int) -> PolyQuotientRing|None:
@@ -141,13 +749,31 @@ def construct_ring(p: str, N: int, q: int) -> PolyQuotientRing|None:
     match p:
         case "-" | "X^N - 1":
             g[[0, N]] =-1, 1
-            pass
+            family = "cyclic"
         case "+" | "X^N + 1":
             g[[0, N]] = 1, 1
-            pass
+            family = "negacyclic"
         case "prime" | "X^N - x - 1":
             g[[0, 1, N]] = -1, -1, 1
+            family = "trinomial"
         case _:
             return None
         
-    return PolyQuotientRing(g, q)
\ No newline at end of file
+    return PolyQuotientRing(g, q, family)
+
+
+def _modulus_family(poly_modulus: VectorInt) -> str | None:
+    r'''Recognizes $X^N - 1$, $X^N + 1$ and $X^N - X - 1$ polynomial moduli (see `PolyQuotientRing.family`).'''
+    g = poly.trim(poly_modulus)
+    N = len(g) - 1
+    if N < 2 or g[N] != 1 or np.count_nonzero(g[2:N]) != 0:
+        return None
+
+    match (g[0], g[1]):
+        case (-1, 0):
+            return "cyclic"
+        case (1, 0):
+            return "negacyclic"
+        case (-1, -1):
+            return "trinomial"
+    return None
\ No newline at end of file
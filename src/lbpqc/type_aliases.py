@@ -131,9 +131,10 @@ def get_predicate(type_name) -> Callable[[Any], bool] | None:
 
 
 def enforce_type_check(func: Callable):
+    sig = signature(func)
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        sig = signature(func)
         bounded_args = sig.bind(*args, **kwargs)
         bounded_args.apply_defaults()
         for arg_name, arg_value in bounded_args.arguments.items():
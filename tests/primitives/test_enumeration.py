@@ -0,0 +1,26 @@
+import itertools
+
+import numpy as np
+
+from lbpqc.primitives.lattice.enumeration import Enumeration
+from lbpqc.primitives.lattice.reductions import LLL
+
+
+def test_svp_and_cvp_match_brute_force():
+    rng = np.random.default_rng(7)
+    for _ in range(10):
+        B = rng.integers(-9, 10, (3, 3))
+        if abs(np.linalg.det(B)) < 0.5:
+            continue
+        B = LLL(B, 0.99)
+        enumeration = Enumeration(B)
+        coefficients = np.array(list(itertools.product(range(-6, 7), repeat=3)))
+
+        vectors = coefficients[coefficients.any(axis=1)] @ B
+        v = enumeration.svp()
+        assert np.isclose(v @ v, np.min(np.sum(vectors ** 2, axis=1)))
+
+        target = rng.normal(0, 20, 3)
+        points = (np.rint(np.linalg.solve(B.T, target)) + coefficients) @ B
+        w = enumeration.cvp(target)
+        assert np.isclose((w - target) @ (w - target), np.min(np.sum((points - target) ** 2, axis=1)))
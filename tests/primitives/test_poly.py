@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from lbpqc.primitives.polynomial import poly
+from lbpqc.primitives.polynomial.polyqring import construct_ring
+
+
+def constant_product(n: int, c: int, d: int) -> np.ndarray:
+    # product of two constant-coefficient polynomials of length n
+    j = np.arange(2 * n - 1)
+    return np.minimum(j + 1, 2 * n - 1 - j).astype(object) * (c * d)
+
+
+@pytest.mark.parametrize("n, bits", [(256, 59), (512, 37), (2048, 35), (32768, 31), (65536, 30)])
+def test_mul_coefficients_near_bit_bound(n, bits):
+    c = (1 << bits) - 1
+    for p_sign, q_sign in [(1, 1), (-1, 1), (-1, -1)]:
+        p = np.full(n, p_sign * c)
+        q = np.full(n, q_sign * c)
+        assert np.all(poly.mul(p, q) == constant_product(n, p_sign * c, q_sign * c))
+        assert np.all(poly.mul(p, np.ones(n, dtype=int)) == constant_product(n, p_sign * c, 1))
+
+
+def test_batch_mul_coefficients_near_bit_bound():
+    c = (1 << 37) - 1
+    P = np.full((3, 512), c)
+    Q = np.ones((3, 512), dtype=int)
+    R = poly.batch_mul(P, Q)
+    for r in R:
+        assert np.all(r == constant_product(512, c, 1))
+
+
+def test_ring_mul_coefficients_near_bit_bound():
+    q = 2 ** 38 + 15
+    ring = construct_ring("-", 512, q)
+    r = ring.mul(np.full(512, 2 ** 37 - 1), np.ones(512, dtype=int))
+    assert np.all(r == 512 * (2 ** 37 - 1) % q)
+
+
+@pytest.mark.parametrize("modulus", [97, 2 ** 40 + 15, 2 ** 62 + 135, 2 ** 63 - 25])
+def test_mul_modulus_unreduced_int64_inputs(modulus):
+    rng = np.random.default_rng(0)
+    p = rng.integers(-2 ** 63, 2 ** 63 - 1, 40, dtype=np.int64)
+    q = rng.integers(-2 ** 63, 2 ** 63 - 1, 40, dtype=np.int64)
+    expected = np.convolve(p.astype(object), q.astype(object)) % modulus
+    assert np.all(poly.mul(p, q, modulus) == expected)
+    assert np.all(poly.batch_mul(p[np.newaxis, :], q[np.newaxis, :], modulus)[0] == expected)
+
+
+def test_mul_modulus_is_trimmed():
+    p, q = np.array([1, 2, 3]), np.array([1, 1])
+    assert np.array_equal(poly.mul(p, q, 3), poly.trim(poly.mul(p, q) % 3))
+    assert np.array_equal(poly.mul(np.array([3]), q, 3), np.array([0]))
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from lbpqc.primitives.polynomial.polyqring import PolyQuotientRing, construct_ring
+
+
+Q = 2 ** 40 + 15
+N = 20
+
+
+def reference_reduce(p, g, q):
+    # long division with python ints by (possibly non-monic) g modulo prime q
+    r, g = [int(x) for x in p], [int(x) for x in g]
+    n = len(g) - 1
+    lc_inv = pow(g[n], -1, q)
+    for k in range(len(r) - 1, n - 1, -1):
+        c = r[k] * lc_inv % q
+        for i in range(n + 1):
+            r[k - n + i] -= c * g[i]
+    return [x % q for x in r[:n]] + [0] * max(0, n - len(r))
+
+
+def reference_mul(a, b, g, q):
+    r = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            r[i + j] += int(x) * int(y)
+    return reference_reduce(r, g, q)
+
+
+def non_cyclic_rings():
+    general = np.array([-3, 5, 0, -7] + [-1] * (N - 4) + [2])
+    return [construct_ring("prime", N, Q), PolyQuotientRing(general, Q)]
+
+
+@pytest.mark.parametrize("ring", non_cyclic_rings())
+def test_rotation_matrix_large_modulus(ring):
+    rng = np.random.default_rng(0)
+    a, b = rng.integers(0, Q, N), rng.integers(0, Q, N)
+    M = ring.rotation_matrix(a)
+    product = [int(x) % Q for x in b.astype(object) @ M.astype(object)]
+    assert product == reference_mul(b, a, ring.poly_modulus, Q)
+
+
+@pytest.mark.parametrize("ring", non_cyclic_rings())
+def test_batch_reduce_and_mul_large_modulus(ring):
+    rng = np.random.default_rng(1)
+    P = rng.integers(0, Q, (4, 2 * N - 1))
+    A, B = rng.integers(0, Q, (4, N)), rng.integers(0, Q, (4, N))
+    reduced = ring.batch_reduce(P)
+    products = ring.batch_mul(A, B)
+    for i in range(4):
+        assert [int(x) for x in reduced[i]] == reference_reduce(P[i], ring.poly_modulus, Q)
+        assert [int(x) for x in products[i]] == reference_mul(A[i], B[i], ring.poly_modulus, Q)
@@ -0,0 +1,47 @@
+import numpy as np
+
+from lbpqc.primitives.lattice.reductions import BKZ, LLL, ReductionStats, is_LLL_reduced
+
+
+def test_LLL_large_entries_returns_lattice_vectors():
+    a, q = 123456789123456789123456789123456789, 2 ** 130 + 3
+    B = np.array([[1, a], [0, q]], dtype=object)
+    L = LLL(B)
+    assert all((v[1] - v[0] * a) % q == 0 for v in L)
+    assert abs(L[0, 0] * L[1, 1] - L[0, 1] * L[1, 0]) == q
+
+
+def test_LLL_large_entries_budget_and_stats():
+    a, q = 123456789123456789123456789123456789, 2 ** 130 + 3
+    B = np.array([[1, a], [0, q]], dtype=object)
+    stats = ReductionStats()
+    L = LLL(B, stats=stats, max_iterations=3)
+    assert not stats.completed and stats.iterations == 3
+    assert abs(L[0, 0] * L[1, 1] - L[0, 1] * L[1, 0]) == q
+
+    stats = ReductionStats()
+    LLL(B, stats=stats)
+    assert stats.completed and stats.swaps > 0 and stats.iterations > 3
+
+
+def test_BKZ_improves_LLL():
+    rng = np.random.default_rng(0)
+    n, q = 20, 3329
+    A = rng.integers(0, q, (n // 2, n // 2))
+    B = np.block([[np.identity(n // 2, dtype=int), A], [np.zeros((n // 2, n // 2), dtype=int), q * np.identity(n // 2, dtype=int)]])
+    L = LLL(B, 0.99)
+    K = BKZ(B, 10)
+    assert K[0] @ K[0] < L[0] @ L[0]
+    assert np.isclose(abs(np.linalg.det(K)), abs(np.linalg.det(B)))
+
+
+def test_LLL_large_entries_is_LLL_reduced():
+    rng = np.random.default_rng(3)
+    n = 20
+    a = [int(x) << 40 | int(y) for x, y in zip(rng.integers(0, 2 ** 40, n), rng.integers(0, 2 ** 40, n))]
+    B = np.zeros((n + 1, n + 1), dtype=object)
+    for i in range(n):
+        B[i, i], B[i, n] = 2, a[i]
+    B[n, :n], B[n, n] = 1, sum(a[:n // 2])
+    L = LLL(B, 0.99)
+    assert is_LLL_reduced(L, 0.99)